@@ -0,0 +1,147 @@
+"""Statistik agregat per cluster untuk KPI, ringkasan cluster dan heatmap korelasi.
+
+Per cluster disimpan statistik cukup (count, jumlah dan cross-product
+terpusat) sekali per versi data. Kombinasi cluster apa pun dijawab dengan
+menggabungkan statistik itu dalam O(jumlah cluster), tanpa memindai baris.
+Hasil untuk filter pencarian, yang tidak bisa diturunkan dari statistik
+per cluster, disimpan di ``AggregateCache`` (LRU).
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+STAT_COLUMNS = ["Recency", "Frequency", "Monetary", "Recency_Scaled", "Frequency_Scaled", "Monetary_Scaled"]
+SCALED_COLUMNS = ["Recency_Scaled", "Frequency_Scaled", "Monetary_Scaled"]
+
+
+class Stats:
+    """Count, sums and centered cross-products of a set of rows.
+
+    Centered cross-products are merged with Chan's pairwise formula, which
+    stays stable for large raw values such as Monetary.
+    """
+
+    def __init__(self, n: int, sums: np.ndarray, comoments: np.ndarray):
+        self.n = int(n)
+        self.sums = sums
+        self.comoments = comoments
+
+    @classmethod
+    def from_values(cls, X: np.ndarray) -> "Stats":
+        X = np.asarray(X, dtype=np.float64)
+        if not len(X):
+            return cls.empty(X.shape[1])
+        centered = X - X.mean(axis=0)
+        return cls(len(X), X.sum(axis=0), centered.T @ centered)
+
+    @classmethod
+    def empty(cls, d: int) -> "Stats":
+        return cls(0, np.zeros(d), np.zeros((d, d)))
+
+    def __add__(self, other: "Stats") -> "Stats":
+        if not self.n:
+            return other
+        if not other.n:
+            return self
+        n = self.n + other.n
+        delta = other.sums / other.n - self.sums / self.n
+        comoments = self.comoments + other.comoments + np.outer(delta, delta) * self.n * other.n / n
+        return Stats(n, self.sums + other.sums, comoments)
+
+    @property
+    def mean(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.sums / self.n
+
+    def corr(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scale = np.sqrt(np.diag(self.comoments))
+            return self.comoments / np.outer(scale, scale)
+
+
+class ClusterAggregates:
+    """Per-cluster ``Stats`` of ``columns``, combinable for any cluster subset."""
+
+    def __init__(self, df: pd.DataFrame, label_column: str = "Cluster_Label", columns=STAT_COLUMNS):
+        self.columns = list(columns)
+        codes, labels = pd.factorize(df[label_column], sort=True)
+        X = df[self.columns].to_numpy(dtype=np.float64)
+        self.stats = {label: Stats.from_values(X[codes == i]) for i, label in enumerate(labels)}
+
+    @classmethod
+    def from_stats(cls, stats: dict, columns=STAT_COLUMNS, order=None) -> "ClusterAggregates":
+        """Build from already computed per-cluster ``Stats`` (e.g. cached per cluster).
+
+        ``order`` is the label order of the ``Cluster_Label`` categorical, the
+        same order ``__init__`` produces; labels not in it follow, sorted.
+        """
+        self = cls.__new__(cls)
+        self.columns = list(columns)
+        order = [label for label in (order if order is not None else []) if label in stats]
+        labels = order + sorted(label for label in stats if label not in order)
+        self.stats = {label: stats[label] for label in labels}
+        return self
+
+    def labels(self) -> list:
+        return list(self.stats)
+
+    def combine(self, clusters=None) -> Stats:
+        """Stats of the union of ``clusters`` (all clusters when ``None``)."""
+        total = Stats.empty(len(self.columns))
+        for label in self.stats if clusters is None else clusters:
+            if label in self.stats:
+                total = total + self.stats[label]
+        return total
+
+    def counts(self) -> pd.Series:
+        return pd.Series({label: s.n for label, s in self.stats.items()}, dtype=np.int64)
+
+    def means(self, clusters=None) -> pd.Series:
+        return pd.Series(self.combine(clusters).mean, index=self.columns)
+
+    def corr(self, columns=SCALED_COLUMNS, clusters=None) -> pd.DataFrame:
+        idx = [self.columns.index(c) for c in columns]
+        matrix = self.combine(clusters).corr()[np.ix_(idx, idx)]
+        return pd.DataFrame(matrix, index=list(columns), columns=list(columns))
+
+    def cluster_summary(self, columns=SCALED_COLUMNS, clusters=None) -> pd.DataFrame:
+        """Same table as the old ``groupby('Cluster_Label').agg(mean)`` + counts."""
+        labels = [label for label in self.stats if clusters is None or label in clusters]
+        labels = [label for label in labels if self.stats[label].n]
+        idx = [self.columns.index(c) for c in columns]
+        summary = pd.DataFrame(
+            [self.stats[label].mean[idx] for label in labels],
+            index=pd.Index(labels, name="Cluster_Label"), columns=list(columns),
+        ).round(4)
+        summary["Jumlah Anggota"] = [self.stats[label].n for label in labels]
+        total = summary["Jumlah Anggota"].sum()
+        summary["Persentase (%)"] = (summary["Jumlah Anggota"] / total * 100).round(2) if total else 0.0
+        return summary
+
+
+class AggregateCache:
+    """Small thread-safe LRU for aggregates of search-filtered views."""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        # Dibangun di luar lock: sesi lain tidak menunggu agregasi ini
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1 @@
+"""Benchmark jalur data dashboard pada skala sintetis (lihat ``benchmarks.run``)."""
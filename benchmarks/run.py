@@ -0,0 +1,222 @@
+"""Benchmark jalur data dashboard pada 10k/100k/1M pelanggan sintetis, tanpa browser.
+
+Yang diukur adalah kode yang sama dengan yang dipakai halaman: pemuatan
+dataset bersama (``shared_data``), filter cluster dan pencarian,
+``cluster_summary``, peringkat top-10, HTML ``gold_table``, serta waktu
+konstruksi dan ukuran JSON setiap figure di ``charts``. Setiap pengukuran
+mengambil waktu terbaik dari ``--repeat`` kali ulang.
+
+Contoh::
+
+    python -m benchmarks.run --sizes 10000 100000
+    python -m benchmarks.run --sizes 10000 --update-baseline
+    python -m benchmarks.run --check          # exit 1 bila ada regresi
+
+Baseline disimpan di ``benchmarks/baseline.json`` per ukuran data; sebuah
+pengukuran dianggap regresi bila lebih lambat dari ``baseline * (1 +
+threshold)`` dan selisihnya di atas ``MIN_DELTA_SECONDS``.
+"""
+import os
+import tempfile
+
+# Dataset benchmark dipublikasikan ke direktori sendiri, bukan shared memory dashboard yang sedang berjalan
+os.environ.setdefault("RFM_SHARED_DIR", tempfile.mkdtemp(prefix="rfm_bench_"))
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import charts
+import rfm_store
+import shared_data
+from aggregates import STAT_COLUMNS, ClusterAggregates
+from benchmarks.synthetic import generate
+from distributions import summarize
+from filters import FilterEngine, FilterView
+from search_index import TrigramIndex
+from snapshots import transition_matrix
+from tables import PagedTable, gold_html
+from theme import PALETTE, RANKING_METRICS, SCATTER_POINT_BUDGET, TOP_K, cluster_names
+from topk import RankingIndex
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = (10_000, 100_000)
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.5
+MIN_DELTA_SECONDS = 0.005
+SCALED = ["Recency_Scaled", "Frequency_Scaled", "Monetary_Scaled"]
+
+
+def best_of(fn, repeat: int):
+    """``(best seconds, last result)`` over ``repeat`` calls."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_suite(n: int, repeat: int = DEFAULT_REPEAT, seed: int = 0, log=print) -> dict:
+    """Time every dashboard data path on ``n`` synthetic customers; returns name -> measurement."""
+    results = {}
+
+    def measure(name, fn, rows=None):
+        seconds, value = best_of(fn, repeat)
+        results[name] = {"seconds": round(seconds, 6), "rows": rows}
+        log(f"  {name:<32} {seconds * 1000:10.2f} ms")
+        return value
+
+    def measure_figure(name, build):
+        fig = measure(f"figure.{name}", build)
+        seconds, payload = best_of(fig.to_json, repeat)
+        results[f"figure.{name}.json"] = {"seconds": round(seconds, 6), "bytes": len(payload)}
+        log(f"  {'figure.' + name + '.json':<32} {seconds * 1000:10.2f} ms {len(payload) / 1024:10.1f} KiB")
+
+    df = generate(n, seed)
+    store_path = os.path.join(shared_data.SHARED_DIR, f"bench_{n}.arrow")
+    rfm_store.write_store(df, store_path)
+    version = f"bench-{n}-{seed}"
+
+    def load_cold():
+        if os.path.exists(shared_data.shared_path(version)):
+            os.remove(shared_data.shared_path(version))
+        shared_data.publish(shared_data.build_table(cluster_names, store_path), version)
+        return load_attach()
+
+    def load_attach():
+        table = shared_data.attach(version)
+        return (
+            shared_data.to_frame(table, rfm_store.RFM_COLUMNS),
+            shared_data.to_frame(table, rfm_store.SCALED_COLUMNS),
+            shared_data.to_frame(table, rfm_store.CLUSTERED_COLUMNS + ["Cluster_Label"]),
+        )
+
+    measure("load_data.cold", load_cold, n)
+    df_rfm, df_norm, df_clustered = measure("load_data.attach", load_attach, n)
+
+    # Filter cluster & pencarian
+    engine = measure("filter.engine", lambda: FilterEngine(df_clustered["Cluster_Label"]), n)
+    cluster = "Regular Customer"
+    view = FilterView(df_clustered, engine, engine.select(cluster))
+    measure("filter.cluster_frame", lambda: FilterView(df_clustered, engine, engine.select(cluster))
+            .frame(["Cluster_Label"] + STAT_COLUMNS), len(view))
+    index = measure("search.index", lambda: TrigramIndex(df_clustered["perusahaan"]), n)
+    hits = measure("search.literal", lambda: index.search("jaya"), n)
+    measure("search.fuzzy", lambda: index.rank("sinar jya"), n)
+    measure("filter.cluster_and_search", lambda: engine.select(cluster, hits), len(hits))
+
+    # Agregat & peringkat
+    aggregates = measure("aggregates.build", lambda: ClusterAggregates(df_clustered), n)
+    summary = measure("cluster_summary", lambda: aggregates.cluster_summary(), n)
+    rankings = measure("ranking.build", lambda: RankingIndex(df_clustered, RANKING_METRICS), n)
+    measure("ranking.top10", lambda: [rankings.top(metric, TOP_K, group)
+                                      for metric in RANKING_METRICS for group in (None, *cluster_names.values())])
+
+    # HTML tabel
+    measure("gold_table.summary", lambda: gold_html(summary.reset_index()), len(summary))
+    measure("gold_table.page", lambda: PagedTable(df_clustered).page_html(
+        0, sort_column="Monetary", ascending=False, columns=["perusahaan", "Cluster", "Cluster_Label"]), n)
+
+    # Figure: waktu konstruksi dan ukuran JSON
+    distributions = measure("distributions.summarize", lambda: {
+        column: summarize(df_norm[column].to_numpy()) for column in SCALED}, n)
+    measure_figure("pie_cluster", lambda: charts.pie_figure(aggregates.counts()))
+    measure_figure("violin_recency", lambda: charts.violin_chart(
+        distributions["Recency_Scaled"], "Recency (Scaled)", PALETTE["navy"]))
+    measure_figure("top_monetary", lambda: charts.ranking_bar(
+        rankings.top("Monetary_Scaled", TOP_K), f"Top {TOP_K} Total Monetary", PALETTE["bronze"]))
+    measure_figure("scatter_3d", lambda: charts.scatter_3d_figure(
+        xyz=df_clustered[SCALED].to_numpy(),
+        raw=df_clustered[["Recency", "Frequency", "Monetary"]].to_numpy(dtype=np.float64),
+        names=df_clustered["perusahaan"].to_numpy(),
+        labels=df_clustered["Cluster_Label"].to_numpy(),
+        point_budget=SCATTER_POINT_BUDGET))
+    measure_figure("heatmap_corr", lambda: charts.correlation_heatmap(aggregates.corr()))
+    measure_figure("hist_frequency", lambda: charts.cluster_histogram(
+        df_clustered[["Cluster_Label", "Frequency_Scaled"]], "Frequency_Scaled", "Sebaran Cluster vs Frequency"))
+    measure_figure("cluster_top_recency", lambda: charts.cluster_ranking_bar(
+        rankings.top("Recency_Scaled", TOP_K, cluster), f"Top {TOP_K} Recency Terendah", PALETTE["navy"]))
+    # Snapshot pembanding: 5% perusahaan pindah cluster
+    after = df_clustered[["perusahaan", "Cluster"]].copy()
+    moved = np.random.default_rng(seed).random(n) < 0.05
+    after.loc[moved, "Cluster"] = (after.loc[moved, "Cluster"] + 1) % len(cluster_names)
+    transitions = measure("transition_matrix", lambda: transition_matrix(
+        df_clustered[["perusahaan", "Cluster"]], after, cluster_names), n)
+    measure_figure("transition_matrix", lambda: charts.transition_heatmap(transitions, "Matriks Transisi"))
+
+    os.remove(store_path)
+    os.remove(shared_data.shared_path(version))
+    return results
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results: dict, path: str = BASELINE_PATH):
+    baseline = load_baseline(path)
+    baseline.setdefault("sizes", {}).update({str(n): r for n, r in results.items()})
+    baseline["environment"] = {
+        "python": platform.python_version(), "machine": platform.machine(), "cpus": os.cpu_count(),
+        "pandas": pd.__version__, "numpy": np.__version__,
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def regressions(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """``(size, name, baseline s, current s)`` for every measurement slower than allowed."""
+    found = []
+    for n, measured in results.items():
+        reference = baseline.get("sizes", {}).get(str(n), {})
+        for name, current in measured.items():
+            if name not in reference:
+                continue
+            before, now = reference[name]["seconds"], current["seconds"]
+            if now > before * (1 + threshold) and now - before > MIN_DELTA_SECONDS:
+                found.append((n, name, before, now))
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark jalur data dashboard RFM pada data sintetis.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="perlambatan relatif yang masih diterima (0.5 = 50%%)")
+    parser.add_argument("--check", action="store_true", help="bandingkan dengan baseline, exit 1 bila regresi")
+    parser.add_argument("--update-baseline", action="store_true", help="simpan hasil sebagai baseline baru")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for n in args.sizes:
+        print(f"n = {n:,}")
+        results[n] = run_suite(n, args.repeat, args.seed)
+
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline diperbarui: {args.baseline}")
+    if args.check:
+        found = regressions(results, load_baseline(args.baseline), args.threshold)
+        for n, name, before, now in found:
+            print(f"REGRESI n={n:,} {name}: {before * 1000:.2f} ms -> {now * 1000:.2f} ms")
+        if found:
+            return 1
+        print("Tidak ada regresi terhadap baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
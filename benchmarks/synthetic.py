@@ -0,0 +1,66 @@
+"""Generator data RFM sintetis dengan skema ``rfm_clustered.csv`` untuk benchmark.
+
+Setiap baris sintetis diambil dari baris sampel dengan cluster yang sama
+lalu diberi noise multiplikatif, jadi proporsi cluster dan bentuk distribusi
+Recency/Frequency/Monetary mengikuti sampel 131 perusahaan. Nama perusahaan
+disusun dari kata-kata nama sampel (unik per baris), agar pencarian trigram
+diuji dengan teks yang realistis. Hasilnya deterministik untuk ``seed`` yang sama.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import rfm_store
+from kmeans_engine import CUSTOMER_TYPES
+from rfm_engine import minmax_scale
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           rfm_store.CSV_FILES["clustered"])
+PREFIXES = np.array(["PT.", "CV.", "UD."])
+
+
+def company_names(n: int, vocabulary: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """``n`` unique names like ``PT. Sinar Jaya 12345``."""
+    prefix = PREFIXES[rng.integers(0, len(PREFIXES), n)]
+    first = vocabulary[rng.integers(0, len(vocabulary), n)]
+    second = vocabulary[rng.integers(0, len(vocabulary), n)]
+    serial = np.arange(n).astype(str)
+    return prefix + " " + first + " " + second + " " + serial
+
+
+def generate(n: int, seed: int = 0, sample_path: str = SAMPLE_PATH) -> pd.DataFrame:
+    """``n`` synthetic customers with the columns of ``rfm_clustered.csv``."""
+    rng = np.random.default_rng(seed)
+    sample = pd.read_csv(sample_path)
+    words = sample["perusahaan"].str.split().explode()
+    vocabulary = words[~words.isin(["PT.", "CV.", "UD."])].unique().astype(str)
+
+    clusters = np.sort(sample["Cluster"].unique())
+    shares = sample["Cluster"].value_counts(normalize=True).reindex(clusters).to_numpy()
+    cluster = rng.choice(clusters, n, p=shares)
+    # Baris sampel sumber: acak di antara anggota cluster yang sama
+    source = np.empty(n, dtype=np.int64)
+    for c in clusters:
+        members = np.flatnonzero(sample["Cluster"].to_numpy() == c)
+        rows = cluster == c
+        source[rows] = members[rng.integers(0, len(members), rows.sum())]
+    base = sample.iloc[source].reset_index(drop=True)
+
+    recency = np.clip(np.rint(base["Recency"] * rng.lognormal(0, 0.15, n)), 1, None).astype(np.int64)
+    frequency = np.clip(np.rint(base["Frequency"] * rng.lognormal(0, 0.2, n)), 1, None).astype(np.int64)
+    monetary = np.rint(base["Monetary"] * rng.lognormal(0, 0.3, n)).astype(np.int64)
+    df = pd.DataFrame({
+        "perusahaan": company_names(n, vocabulary, rng),
+        "Recency": recency,
+        "Frequency": frequency,
+        "Monetary": monetary,
+        "IF_Label": 1,
+        "IF_Score": np.clip(base["IF_Score"] + rng.normal(0, 0.01, n), 0, 0.5),
+        "Is_Outlier": 0,
+    })
+    df = minmax_scale(df)
+    df["Cluster"] = cluster
+    df["Customer_Type"] = pd.Series(cluster).map(CUSTOMER_TYPES).to_numpy()
+    df["Tanggal_Analisis"] = base["Tanggal_Analisis"].to_numpy()
+    return df[rfm_store.CLUSTERED_COLUMNS]
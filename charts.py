@@ -0,0 +1,157 @@
+"""Pembuat figure dashboard sebagai fungsi murni (data masuk, ``go.Figure`` keluar).
+
+Halaman di ``views`` memanggil fungsi ini dari builder cache figure, dan
+``benchmarks`` memakainya untuk mengukur waktu konstruksi dan ukuran JSON
+tiap figure tanpa Streamlit. Plotly Express diimpor di dalam fungsi, jadi
+baru dimuat saat sebuah figure benar-benar dibangun (cache miss).
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from distributions import DistributionSummary, violin_figure
+from lod import scatter_3d_traces
+from theme import PALETTE, color_map, plotly_dark_theme
+
+HEATMAP_SCALE = ["#FFF7E0", "#F6C90E", "#D4A017", "#8C5A10"]
+PIE_ORDER = ["High Value Customer", "Regular Customer", "Low Value Customer"]
+
+
+def pie_figure(counts: pd.Series) -> go.Figure:
+    import plotly.express as px
+    cluster_counts = counts.reindex(PIE_ORDER, fill_value=0)
+
+    fig_pie = px.pie(
+        names=cluster_counts.index,
+        values=cluster_counts.values,
+        color=cluster_counts.index,
+        color_discrete_map=color_map,
+    )
+    fig_pie.update_traces(
+        textinfo='percent+label',
+        textfont=dict(size=10, family="Poppins", color="white"),
+        pull=[0.06]*len(cluster_counts),
+        hoverlabel=dict(font_size=13),
+        marker=dict(line=dict(color='black', width=2))
+    )
+    fig_pie.update_layout(plotly_dark_theme,
+        legend=dict(orientation="h", yanchor="top", y=-0.15, xanchor="center", x=0.5),
+        height=620,
+        margin=dict(t=30, b=10, l=10, r=10),
+        plot_bgcolor=PALETTE["dark_bg"],
+        paper_bgcolor=PALETTE["dark_bg"],
+        title=''
+    )
+    return fig_pie
+
+
+def violin_chart(summary: DistributionSummary, title: str, color: str) -> go.Figure:
+    fig = violin_figure(summary, title, color)
+    fig.update_layout(plotly_dark_theme, height=170, title_font=dict(size=14), margin=dict(t=20, b=10, l=10, r=10))
+    return fig
+
+
+def ranking_bar(top: pd.Series, title: str, color: str, show_values: bool = False) -> go.Figure:
+    """Vertical top-k bar chart (company on the x axis)."""
+    import plotly.express as px
+    fig = px.bar(
+        top,
+        x=top.index,
+        y=top.values,
+        title=title,
+        color_discrete_sequence=[color]
+    )
+    if show_values:
+        fig.update_traces(text=top.values, textposition='outside')
+    fig.update_layout(plotly_dark_theme, height=450)
+    return fig
+
+
+def cluster_ranking_bar(top: pd.Series, title: str, color: str) -> go.Figure:
+    """Horizontal top-k bar chart of one cluster, best first."""
+    import plotly.express as px
+    fig = px.bar(top, x=top.values, y=top.index, orientation="h", title=title,
+                 color_discrete_sequence=[color])
+    fig.update_layout(plotly_dark_theme, height=400, yaxis=dict(autorange="reversed"))
+    return fig
+
+
+def scatter_3d_figure(xyz: np.ndarray, raw: np.ndarray, names: np.ndarray, labels: np.ndarray,
+                      detail: np.ndarray = None, point_budget: int = 20_000) -> go.Figure:
+    traces = scatter_3d_traces(xyz=xyz, raw=raw, names=names, labels=labels, color_map=color_map,
+                               detail=detail, point_budget=point_budget)
+    fig_3d = go.Figure(traces)
+    fig_3d.update_layout(
+        plotly_dark_theme,
+        title="Visualisasi 3D RFM Clustering",
+        legend_title_text="Cluster_Label",
+        width=1000,
+        height=700,
+        scene=dict(
+            xaxis_title='Recency_Scaled',
+            yaxis_title='Frequency_Scaled',
+            zaxis_title='Monetary_Scaled',
+            xaxis=dict(backgroundcolor="#1A1A1A", gridcolor="#333", zerolinecolor="#333"),
+            yaxis=dict(backgroundcolor="#1A1A1A", gridcolor="#333", zerolinecolor="#333"),
+            zaxis=dict(backgroundcolor="#1A1A1A", gridcolor="#333", zerolinecolor="#333"),
+            aspectratio=dict(x=1, y=1, z=0.8)
+        ),
+        margin=dict(l=0, r=0, b=0, t=60),
+        paper_bgcolor=PALETTE["dark_bg"],
+        plot_bgcolor=PALETTE["dark_bg"]
+    )
+    return fig_3d
+
+
+def correlation_heatmap(corr: pd.DataFrame) -> go.Figure:
+    import plotly.express as px
+    fig_heat = px.imshow(
+        corr,
+        color_continuous_scale=HEATMAP_SCALE,
+        title="Heatmap Korelasi RFM",
+        text_auto=True,
+        aspect="auto"
+    )
+    fig_heat.update_layout(plotly_dark_theme,
+        coloraxis_colorbar=dict(title="Corr", tickfont=dict(color=PALETTE["white_text"]))
+    )
+    fig_heat.update_xaxes(side="top")
+    return fig_heat
+
+
+def cluster_histogram(frame: pd.DataFrame, column: str, title: str) -> go.Figure:
+    import plotly.express as px
+    return px.histogram(frame, x='Cluster_Label', y=column,
+                        color='Cluster_Label', barmode='group', title=title,
+                        color_discrete_map=color_map).update_layout(plotly_dark_theme)
+
+
+def transition_heatmap(transitions: pd.DataFrame, title: str) -> go.Figure:
+    import plotly.express as px
+    fig_trans = px.imshow(
+        transitions,
+        color_continuous_scale=HEATMAP_SCALE,
+        title=title,
+        text_auto=True,
+        aspect="auto",
+        labels=dict(x="Cluster Akhir", y="Cluster Awal", color="Jumlah"),
+    )
+    fig_trans.update_layout(plotly_dark_theme, height=450)
+    fig_trans.update_xaxes(side="top")
+    return fig_trans
+
+
+def k_sweep_figure(sweep: pd.DataFrame, current_k: int) -> go.Figure:
+    """Inertia (elbow), Davies-Bouldin and silhouette per k side by side; the deployed k is marked."""
+    from plotly.subplots import make_subplots
+    panels = [("inertia", "Inertia (elbow)", PALETTE["gold"]),
+              ("davies_bouldin", "Davies-Bouldin (↓)", PALETTE["bronze"]),
+              ("silhouette", "Silhouette sampel (↑)", PALETTE["navy"])]
+    fig = make_subplots(rows=1, cols=len(panels), subplot_titles=[title for _, title, _ in panels])
+    for col, (column, title, color) in enumerate(panels, start=1):
+        fig.add_trace(go.Scatter(x=sweep["k"], y=sweep[column], mode="lines+markers", name=title,
+                                 line=dict(color=color, width=3), marker=dict(size=9)), row=1, col=col)
+        fig.add_vline(x=current_k, line=dict(color=PALETTE["white_text"], dash="dot"), row=1, col=col)
+        fig.update_xaxes(title_text="k", dtick=1, row=1, col=col)
+    fig.update_layout(plotly_dark_theme, height=420, showlegend=False, margin=dict(t=60, b=10, l=10, r=10))
+    return fig
@@ -0,0 +1,239 @@
+"""Sumber daya bersama halaman dashboard: data, cache dan helper render.
+
+Semua getter ``st.cache_resource`` ada di sini agar setiap modul halaman di
+``views`` memakai entri cache yang sama, apa pun halaman yang dimuat lebih
+dulu.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import shared_data
+from aggregates import STAT_COLUMNS, AggregateCache, ClusterAggregates, Stats
+from disk_cache import DiskCache
+from distributions import summarize
+from figure_cache import FigureCache
+from filters import FilterEngine
+from hot_reload import DataWatcher
+from profiler import Profiler
+from search_index import TrigramIndex
+from tables import PagedTable, gold_html
+from theme import RANKING_METRICS, SCATTER_POINT_BUDGET, TOP_K, cluster_names
+from topk import RankingIndex
+
+@st.cache_resource
+def get_profiler():
+    # Waktu per bagian rerun: panel sidebar + log JSONL berotasi (p50/p95)
+    return Profiler()
+
+@st.cache_resource
+def get_disk_cache():
+    # Artefak turunan bertahan antar restart; kunci memuat versi data, direktori memuat versi aplikasi
+    return DiskCache()
+
+@st.cache_resource
+def get_figure_cache():
+    # JSON figure jadi, dibagi semua sesi; dibatasi ukuran (LRU), cadangan di disk
+    return FigureCache(max_bytes=64 * 1024 * 1024, store=get_disk_cache())
+
+@st.cache_resource
+def get_data_watcher():
+    # Satu watcher per proses: versi data baru dimuat di thread latar belakang, tanpa restart server.
+    # Dataset read-only (termasuk Cluster_Label) ada di shared memory, dipakai semua sesi & proses.
+    figure_cache = get_figure_cache()
+    disk_cache = get_disk_cache()
+
+    def discard_stale_figures(old, new):
+        # Hanya figure versi lama & cluster yang berubah yang dibuang
+        live = {new.version} | set(new.cluster_versions.values())
+        figure_cache.discard(lambda key: key[0] not in live)
+
+    watcher = DataWatcher(lambda version: shared_data.load_shared(version, cluster_names, disk_cache))
+    watcher.subscribe(discard_stale_figures)
+    return watcher.start()
+
+def load_data():
+    """Data state of the current version (``None`` if the data files are missing or inconsistent).
+
+    Callers read it once per rerun and pass it on, so a swap by the watcher
+    mid-rerun never mixes two versions.
+    """
+    with get_profiler().section("data.load") as timing:
+        state = get_data_watcher().state
+        timing.rows = None if state is None else len(state.frames[2])
+    if state is None:
+        error = get_data_watcher().error
+        if isinstance(error, ValueError):
+            st.error(f"Data RFM tidak dapat dimuat: {error}")
+        else:
+            st.error("Pastikan file CSV (rfm_tanpa_outlier.csv, rfm_minmax_scaled.csv, rfm_clustered.csv) berada di lokasi yang benar.")
+    return state
+
+@st.cache_resource(max_entries=2)
+def get_search_index(_names, data_version):
+    # Dibangun sekali per versi data, dipakai bersama oleh semua sesi
+    return TrigramIndex(_names)
+
+@st.cache_resource(max_entries=2)
+def get_filter_engine(_labels, data_version):
+    # Bitmap & posisi per cluster, dihitung sekali per versi data
+    return FilterEngine(_labels)
+
+@st.cache_resource(max_entries=16)
+def get_cluster_stats(_df, _positions, label, cluster_version):
+    # Statistik satu cluster; dihitung ulang hanya bila cluster itu berubah saat reload
+    return get_disk_cache().get_or_build(
+        ("cluster_stats", label, cluster_version),
+        lambda: Stats.from_values(_df[STAT_COLUMNS].take(_positions).to_numpy(dtype=np.float64))
+    )
+
+@st.cache_resource(max_entries=2)
+def get_aggregates(_df, data_version, _cluster_versions):
+    # Statistik per cluster: KPI, ringkasan & korelasi tanpa memindai baris
+    def build():
+        engine = get_filter_engine(_df["Cluster_Label"], data_version)
+        return ClusterAggregates.from_stats({
+            label: get_cluster_stats(_df, engine.positions[label], label, _cluster_versions[label])
+            for label in engine.labels
+        }, order=list(_df["Cluster_Label"].cat.categories))
+    return get_disk_cache().get_or_build(("aggregates", data_version), build)
+
+@st.cache_resource(max_entries=2)
+def get_aggregate_cache(data_version):
+    # LRU untuk hasil filter pencarian; cache baru untuk setiap versi data
+    return AggregateCache(maxsize=64)
+
+@st.cache_resource(max_entries=2)
+def get_distributions(_df, data_version):
+    # Ringkasan violin (KDE, box, sampel berstrata) per kolom scaled
+    return get_disk_cache().get_or_build(
+        ("distributions", data_version),
+        lambda: {column: summarize(_df[column].to_numpy())
+                 for column in ['Recency_Scaled', 'Frequency_Scaled', 'Monetary_Scaled']}
+    )
+
+@st.cache_resource
+def get_snapshot(date, snapshot_version):
+    # Satu snapshot per entri cache: berganti snapshot tidak memuat ulang yang lain
+    from snapshots import SnapshotStore
+
+    return SnapshotStore().load(date)
+
+@st.cache_resource(max_entries=2)
+def get_rankings(_df, data_version):
+    # Top-k per metrik & per cluster lewat argpartition, sekali per versi data
+    return RankingIndex(_df, RANKING_METRICS)
+
+@st.cache_resource(max_entries=2)
+def get_diagnostics(_df, data_version):
+    # Sweep k (process pool) + kualitas cluster saat ini; mahal, jadi sekali per versi data & disimpan di disk
+    # Diimpor di sini: mesin sweep hanya dimuat oleh halaman Diagnostik
+    import diagnostics
+
+    def build():
+        X = _df[diagnostics.FEATURES].to_numpy(dtype=np.float64)
+        return (diagnostics.k_sweep(X, diagnostics.DEFAULT_KS),
+                diagnostics.labelling_quality(X, _df["Cluster"].to_numpy()))
+    return get_disk_cache().get_or_build(
+        ("diagnostics", data_version, diagnostics.DEFAULT_KS, diagnostics.SILHOUETTE_SAMPLE), build
+    )
+
+def plotly_chart_cached(chart_id, params, build, version, **kwargs):
+    """Render a figure from the shared cache; ``build()`` runs only on a miss.
+
+    ``version`` is the data version; charts of a single cluster pass that
+    cluster's token so they survive reloads that leave it unchanged.
+    """
+    profiler, figure_cache = get_profiler(), get_figure_cache()
+    key = (version, chart_id, params)
+    name = chart_id if isinstance(chart_id, str) else ".".join(map(str, chart_id))
+    misses = figure_cache.misses
+    with profiler.section(f"figure.{name}") as timing:
+        fig = figure_cache.get_or_build(key, build)
+        timing.bytes = figure_cache.size_of(key)
+        if figure_cache.misses != misses:
+            timing.name += ".build"
+    with profiler.section(f"plotly_chart.{name}", nbytes=timing.bytes):
+        st.plotly_chart(fig, **kwargs)
+
+def gold_table(df: pd.DataFrame, index=False):
+    """Convert DataFrame to HTML table with custom class 'custom-table'."""
+    with get_profiler().section("table.html", rows=len(df)) as timing:
+        html = gold_html(df, index=index)
+        timing.bytes = len(html)
+    return html
+
+@st.cache_resource(max_entries=4)
+def get_paged_table(_df, table_id, data_version):
+    # Satu tabel berhalaman per versi data; urutan & fragmen HTML di-cache di dalamnya
+    return PagedTable(_df, store=get_disk_cache(), store_key=(table_id, data_version))
+
+def paged_table(table: PagedTable, key, columns, default_sort=None, subset_key=None, subset_mask=None):
+    """Render only the visible page of ``table`` in the gold scroll-table, with sort & page controls."""
+    sort_options = ["(default)"] + list(columns)
+    col_sort, col_dir, col_page = st.columns([2, 1, 1])
+    with col_sort:
+        sort_choice = st.selectbox("Urutkan berdasarkan:", sort_options, key=f"{key}_sort")
+    with col_dir:
+        descending = st.checkbox("Menurun", key=f"{key}_desc")
+    sort_column = default_sort if sort_choice == "(default)" else sort_choice
+    order_kwargs = dict(sort_column=sort_column, ascending=not descending,
+                        subset_key=subset_key, subset_mask=subset_mask)
+    n_rows = table.n_rows(**order_kwargs)
+    n_pages = table.n_pages(**order_kwargs)
+    with col_page:
+        page = st.number_input("Halaman", min_value=1, max_value=n_pages, value=1, step=1, key=f"{key}_page")
+    page = min(int(page), n_pages) - 1
+    start = page * table.page_size
+    st.caption(f"Baris {min(start + 1, n_rows):,}–{min(start + table.page_size, n_rows):,} dari {n_rows:,}")
+    with get_profiler().section(f"table.page.{key}", rows=min(table.page_size, max(n_rows - start, 0))) as timing:
+        html = table.page_html(page, columns=columns, **order_kwargs)
+        timing.bytes = len(html)
+    st.markdown(f"""
+    <div class="scroll-table">
+        {html}
+    </div>
+    """, unsafe_allow_html=True)
+    return n_rows
+
+def export_buttons(df: pd.DataFrame, positions, export_key, data_version, file_stem: str):
+    """CSV & Parquet download buttons for the rows at ``positions`` (``None`` = all rows).
+
+    The file is streamed to the disk cache in chunks on the first click and
+    reused for the same ``export_key`` (filter state) and data version.
+    """
+    # Diimpor di sini agar halaman tanpa tombol ekspor tidak memuat modul ekspor
+    import export
+
+    def file_bytes(fmt):
+        def read():
+            with get_profiler().section(f"export.{fmt}", rows=len(df) if positions is None else len(positions)) as timing:
+                path = get_disk_cache().get_or_write(
+                    ("export", export_key, data_version, fmt),
+                    lambda: export.iter_export(fmt, df, positions),
+                    export.FORMATS[fmt][1],
+                )
+                with open(path, "rb") as f:
+                    data = f.read()
+                timing.bytes = len(data)
+            return data
+        return read
+
+    for col, fmt in zip(st.columns(len(export.FORMATS)), export.FORMATS):
+        mime, suffix = export.FORMATS[fmt]
+        with col:
+            # Data dibuat saat tombol diklik (callable), bukan setiap rerun
+            st.download_button(f"⬇️ Unduh {fmt.upper()}", data=file_bytes(fmt), file_name=f"{file_stem}{suffix}",
+                               mime=mime, key=f"export_{file_stem}_{fmt}", on_click="ignore")
+
+def profiler_panel():
+    """Optional sidebar panel: sections of this rerun and process-wide p50/p95."""
+    if not st.sidebar.checkbox("⏱️ Tampilkan profiler", key="profiler_panel"):
+        return
+    profiler = get_profiler()
+    with st.sidebar:
+        st.markdown("**Rerun ini**")
+        st.dataframe(pd.DataFrame(profiler.run_records(), columns=["section", "ms", "rows", "bytes"]),
+                     hide_index=True)
+        st.markdown(f"**p50/p95 proses ini** (log: `{profiler.log_path}`)")
+        st.dataframe(profiler.summary()[["section", "count", "p50_ms", "p95_ms"]], hide_index=True)
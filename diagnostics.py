@@ -0,0 +1,165 @@
+"""Diagnostik kualitas cluster: sweep K-Means untuk beberapa k sebagai dasar pemilihan k.
+
+Untuk setiap k, ``MiniBatchKMeans`` dari ``kmeans_engine`` di-fit pada
+seluruh pelanggan lalu dihitung:
+
+* inertia (jumlah jarak kuadrat ke centroid, untuk kurva elbow),
+* indeks Davies-Bouldin (dari jarak ke centroid, O(n·k)),
+* silhouette pada sampel berstrata per cluster. Silhouette eksak O(n²)
+  tidak mungkin untuk jumlah pelanggan kita, jadi jarak berpasangan
+  dihitung per chunk baris sampel dan memori tetap ``chunk_size × sample_size``.
+
+Setiap k dikerjakan oleh satu proses di process pool; fitur dikirim sekali
+ke setiap worker lewat initializer.
+
+Contoh::
+
+    python diagnostics.py --input rfm_clustered.csv --k-min 2 --k-max 10
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from kmeans_engine import FEATURES, MiniBatchKMeans, assign
+
+DEFAULT_KS = tuple(range(2, 11))
+SILHOUETTE_SAMPLE = 5_000
+DEFAULT_CHUNK = 1_024
+
+
+def davies_bouldin(X: np.ndarray, labels: np.ndarray, centroids: np.ndarray) -> float:
+    """Davies-Bouldin index (lower is better); empty clusters are ignored."""
+    k = len(centroids)
+    distances = np.sqrt(((X - centroids[labels]) ** 2).sum(axis=1))
+    counts = np.bincount(labels, minlength=k)
+    used = counts > 0
+    if used.sum() < 2:
+        return float("nan")
+    scatter = (np.bincount(labels, weights=distances, minlength=k) / np.maximum(counts, 1))[used]
+    centers = centroids[used]
+    separation = np.sqrt(((centers[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2))
+    np.fill_diagonal(separation, np.inf)
+    ratio = (scatter[:, None] + scatter[None, :]) / separation
+    return float(ratio.max(axis=1).mean())
+
+
+def stratified_sample(labels: np.ndarray, size: int, rng: np.random.Generator) -> np.ndarray:
+    """Row positions of a sample with each cluster's share of ``labels`` (at least 2 rows per cluster)."""
+    if len(labels) <= size:
+        return np.arange(len(labels))
+    picked = []
+    for label in np.unique(labels):
+        members = np.flatnonzero(labels == label)
+        take = min(len(members), max(2, int(round(size * len(members) / len(labels)))))
+        picked.append(rng.choice(members, take, replace=False))
+    return np.sort(np.concatenate(picked))
+
+
+def sampled_silhouette(X: np.ndarray, labels: np.ndarray, sample_size: int = SILHOUETTE_SAMPLE,
+                       chunk_size: int = DEFAULT_CHUNK, random_state: int = 0) -> float:
+    """Mean silhouette over a stratified sample, with pairwise distances computed chunk by chunk."""
+    sample = stratified_sample(labels, sample_size, np.random.default_rng(random_state))
+    S, codes = X[sample], np.unique(labels[sample], return_inverse=True)[1]
+    k = codes.max() + 1
+    if k < 2:
+        return float("nan")
+    counts = np.bincount(codes, minlength=k).astype(np.float64)
+    members = np.zeros((len(S), k))
+    members[np.arange(len(S)), codes] = 1.0
+    s_sq = np.einsum("ij,ij->i", S, S)
+
+    scores = np.empty(len(S))
+    for start in range(0, len(S), chunk_size):
+        rows = slice(start, start + chunk_size)
+        d = np.sqrt(np.maximum(s_sq[rows, None] - 2.0 * S[rows] @ S.T + s_sq, 0.0))
+        # Rata-rata jarak ke setiap cluster; jarak ke diri sendiri (0) tidak dihitung untuk cluster sendiri
+        sums = d @ members
+        own = codes[rows]
+        idx = np.arange(len(own))
+        a = sums[idx, own] / np.maximum(counts[own] - 1, 1)
+        means = sums / counts
+        means[idx, own] = np.inf
+        b = means.min(axis=1)
+        chunk_scores = (b - a) / np.maximum(np.maximum(a, b), 1e-12)
+        chunk_scores[counts[own] == 1] = 0.0
+        scores[rows] = chunk_scores
+    return float(scores.mean())
+
+
+def evaluate_k(X: np.ndarray, k: int, sample_size: int = SILHOUETTE_SAMPLE, random_state: int = 0) -> dict:
+    """Fit K-Means with ``k`` clusters on ``X`` and score the result."""
+    model = MiniBatchKMeans(n_clusters=k, random_state=random_state + k).fit(X)
+    labels, distances = assign(X, model.centroids)
+    return {
+        "k": k,
+        "inertia": float(distances.sum()),
+        "davies_bouldin": davies_bouldin(X, labels, model.centroids),
+        "silhouette": sampled_silhouette(X, labels, sample_size, random_state=random_state),
+    }
+
+
+# Fitur per proses worker, diisi sekali oleh initializer pool
+_worker_X = None
+
+
+def _init_worker(X):
+    global _worker_X
+    _worker_X = X
+
+
+def _evaluate_worker(args) -> dict:
+    k, sample_size, random_state = args
+    return evaluate_k(_worker_X, k, sample_size, random_state)
+
+
+def k_sweep(X: np.ndarray, ks=DEFAULT_KS, n_jobs: int = None, sample_size: int = SILHOUETTE_SAMPLE,
+            random_state: int = 0) -> pd.DataFrame:
+    """Inertia, Davies-Bouldin and sampled silhouette per ``k``, one process per ``k``."""
+    X = np.asarray(X, dtype=np.float64)
+    ks = [k for k in ks if k < len(X)]
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(ks) or 1)
+    tasks = [(k, sample_size, random_state) for k in ks]
+    if n_jobs == 1:
+        rows = [evaluate_k(X, *task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(X,)) as pool:
+            rows = list(pool.map(_evaluate_worker, tasks))
+    return pd.DataFrame(rows, columns=["k", "inertia", "davies_bouldin", "silhouette"])
+
+
+def labelling_quality(X: np.ndarray, labels: np.ndarray, sample_size: int = SILHOUETTE_SAMPLE,
+                      random_state: int = 0) -> dict:
+    """Davies-Bouldin and sampled silhouette of an existing labelling (the ``Cluster`` column)."""
+    X = np.asarray(X, dtype=np.float64)
+    labels = np.asarray(labels, dtype=np.int64)
+    centroids = np.zeros((labels.max() + 1, X.shape[1]))
+    np.add.at(centroids, labels, X)
+    centroids /= np.maximum(np.bincount(labels, minlength=len(centroids)), 1)[:, None]
+    return {
+        "k": int(len(np.unique(labels))),
+        "inertia": float(((X - centroids[labels]) ** 2).sum()),
+        "davies_bouldin": davies_bouldin(X, labels, centroids),
+        "silhouette": sampled_silhouette(X, labels, sample_size, random_state=random_state),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep K-Means untuk beberapa k: inertia, Davies-Bouldin, silhouette.")
+    parser.add_argument("--input", default="rfm_clustered.csv")
+    parser.add_argument("--k-min", type=int, default=DEFAULT_KS[0])
+    parser.add_argument("--k-max", type=int, default=DEFAULT_KS[-1])
+    parser.add_argument("--sample", type=int, default=SILHOUETTE_SAMPLE, help="ukuran sampel silhouette")
+    parser.add_argument("--jobs", type=int, default=None, help="jumlah proses (default: semua core)")
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.input)
+    X = data[FEATURES].to_numpy(dtype=np.float64)
+    sweep = k_sweep(X, range(args.k_min, args.k_max + 1), n_jobs=args.jobs, sample_size=args.sample)
+    print(sweep.to_string(index=False))
+    if "Cluster" in data:
+        current = labelling_quality(X, data["Cluster"].to_numpy(), args.sample)
+        print(f"\nCluster saat ini (k={current['k']}): Davies-Bouldin {current['davies_bouldin']:.3f}, "
+              f"silhouette {current['silhouette']:.3f}")
@@ -0,0 +1,239 @@
+"""Cache persisten di disk untuk artefak turunan (dataset, agregat, figure, halaman tabel).
+
+Entri disimpan sebagai file pickle di ``<root>/<versi aplikasi>/``. Versi
+aplikasi adalah hash kode modul dashboard plus versi pandas/plotly, jadi
+deploy kode baru otomatis memakai namespace baru; versi data (hash isi
+file) sudah menjadi bagian kunci dari pemanggil. Namespace versi lain baru
+dihapus setelah tidak ditulis selama ``PRUNE_GRACE_SECONDS``, jadi proses
+versi lama yang masih berjalan saat rolling deploy tidak kehilangan cache. Total ukuran dibatasi
+``max_bytes`` dengan eviction LRU (mtime file diperbarui saat dibaca).
+File besar seperti ekspor CSV/Parquet ditulis per chunk sebagai entri file
+biasa (``write_chunks``) dan ikut LRU yang sama.
+
+Restart server dengan cache hangat menggambar "Analisis Deskriptif" tanpa
+menghitung ulang apa pun. Cache bisa diisi sebelum deploy::
+
+    python disk_cache.py warm
+    python disk_cache.py stats
+    python disk_cache.py clear
+    python disk_cache.py prune   # hapus semua namespace versi lain sekarang
+"""
+import argparse
+import glob
+import hashlib
+import os
+import pickle
+import shutil
+import threading
+import time
+
+import pandas as pd
+import plotly
+
+CACHE_DIR = os.environ.get("RFM_CACHE_DIR", ".rfm_cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+ENTRY_SUFFIX = ".pkl"
+TMP_SUFFIX = ".tmp"
+PRUNE_GRACE_SECONDS = 24 * 60 * 60
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+# Kode yang ikut menentukan isi artefak: modul di root dan modul halaman
+SOURCE_PATTERNS = ("*.py", os.path.join("views", "*.py"))
+
+
+def app_version(source_dir: str = APP_DIR) -> str:
+    """Fingerprint of the dashboard code and the libraries that shape its artifacts."""
+    digest = hashlib.sha1(f"pandas={pd.__version__};plotly={plotly.__version__}".encode())
+    paths = [path for pattern in SOURCE_PATTERNS for path in glob.glob(os.path.join(source_dir, pattern))]
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, source_dir).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def entry_name(key, suffix: str = ENTRY_SUFFIX) -> str:
+    """File name of ``key``; keys are tuples of str/int/bool/None, so ``repr`` is stable."""
+    return hashlib.sha1(repr(key).encode()).hexdigest() + suffix
+
+
+class DiskCache:
+    """Size-bounded LRU of pickled artifacts under ``root/<version>``."""
+
+    def __init__(self, root: str = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES, version: str = None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.version = version or app_version()
+        self.path = os.path.join(root, self.version)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+        self._prune_other_versions()
+        self.size_bytes = sum(size for _, _, size in self._entries())
+
+    def _prune_other_versions(self, grace: float = PRUNE_GRACE_SECONDS) -> int:
+        """Remove other versions' directories not written to for ``grace`` seconds."""
+        cutoff = time.time() - grace
+        pruned = 0
+        for entry in os.scandir(self.root):
+            if entry.name == self.version or not entry.is_dir():
+                continue
+            try:
+                # mtime direktori berubah setiap entri ditulis atau dihapus
+                if entry.stat().st_mtime > cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+            pruned += 1
+        return pruned
+
+    def _entries(self) -> list:
+        entries = []
+        for entry in os.scandir(self.path):
+            # Entri pickle maupun file hasil ``write_chunks`` (ekspor); file .tmp sedang ditulis
+            if not entry.name.endswith(TMP_SUFFIX):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime_ns, entry.path, st.st_size))
+        return entries
+
+    def get(self, key, default=None):
+        path = os.path.join(self.path, entry_name(key))
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            with self._lock:
+                self.misses += 1
+            return default
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+        self.write_chunks(key, [payload], ENTRY_SUFFIX)
+
+    def file_path(self, key, suffix: str):
+        """Path of the file entry ``key`` (marked as recently used), or ``None`` on a miss."""
+        path = os.path.join(self.path, entry_name(key, suffix))
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def write_chunks(self, key, chunks, suffix: str) -> str:
+        """Stream byte ``chunks`` into the file entry ``key``; only one chunk is in memory at a time."""
+        path = os.path.join(self.path, entry_name(key, suffix))
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}{TMP_SUFFIX}"
+        size = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            # Entri yang ditimpa tidak boleh terhitung dua kali di ``size_bytes``
+            try:
+                replaced = os.stat(path).st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        with self._lock:
+            self.size_bytes += size - replaced
+            if self.size_bytes > self.max_bytes:
+                self._evict(keep=path)
+        return path
+
+    def get_or_write(self, key, chunks, suffix: str) -> str:
+        """Path of the file entry ``key``; ``chunks()`` is streamed to disk only on a miss."""
+        return self.file_path(key, suffix) or self.write_chunks(key, chunks(), suffix)
+
+    def _evict(self, keep: str = None):
+        # Ukuran dihitung ulang dari disk: proses lain bisa ikut menulis ke direktori yang sama
+        entries = sorted(self._entries())
+        self.size_bytes = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if self.size_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.size_bytes -= size
+
+    def get_or_build(self, key, build):
+        """Cached value of ``key``; ``build()`` runs and is persisted only on a miss."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            shutil.rmtree(self.path, ignore_errors=True)
+            os.makedirs(self.path, exist_ok=True)
+            self.size_bytes = 0
+
+
+def warm(app_path: str = os.path.join(APP_DIR, "app.py"), timeout: float = 600):
+    """Run every dashboard view once headlessly so its artifacts land in the disk cache."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=timeout).run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    # Elemen widget diambil ulang setiap run: referensi lama tidak ikut diperbarui
+    for option in at.sidebar.radio[0].options:
+        at.sidebar.radio[0].set_value(option).run()
+        if option == "Analisis Clustering":
+            # Setiap pilihan cluster punya figure sendiri
+            for cluster in at.selectbox[0].options[1:]:
+                at.selectbox[0].set_value(cluster).run()
+            at.selectbox[0].set_value("Semua").run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        print(f"Tampilan '{option}' dihangatkan")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kelola cache artefak dashboard di disk.")
+    parser.add_argument("--root", default=CACHE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("warm", help="isi cache dengan menjalankan semua tampilan dashboard")
+    sub.add_parser("stats", help="tampilkan versi, jumlah entri dan ukuran cache")
+    sub.add_parser("clear", help="hapus cache versi aplikasi saat ini")
+    sub.add_parser("prune", help="hapus cache semua versi aplikasi lain tanpa masa tenggang")
+    args = parser.parse_args()
+
+    if args.command == "warm":
+        # Dashboard membaca lokasi cache dari environment
+        os.environ["RFM_CACHE_DIR"] = args.root
+        warm()
+    cache = DiskCache(args.root)
+    if args.command == "clear":
+        cache.clear()
+    elif args.command == "prune":
+        print(f"{cache._prune_other_versions(grace=0)} namespace versi lain dihapus")
+    print(f"Versi aplikasi {cache.version}: {len(cache._entries())} entri, "
+          f"{cache.size_bytes / 1024 / 1024:.1f} MB di {cache.path}")
@@ -0,0 +1,109 @@
+"""Ekspor daftar pelanggan hasil filter ke CSV/Parquet secara streaming.
+
+Baris hasil filter (posisi dari ``FilterEngine``/``FilterView``) diambil per
+chunk, diserialisasi oleh writer Arrow (CSV atau Parquet) lalu di-``yield``
+sebagai bytes, jadi file lengkap tidak pernah dibangun di memori. Dashboard menulis chunk ini ke cache disk
+per state filter dan versi data, sehingga ekspor kampanye yang sama
+berikutnya langsung tersedia.
+"""
+import io
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+CHUNK_ROWS = 50_000
+EXPORT_COLUMNS = [
+    "perusahaan", "Recency", "Frequency", "Monetary",
+    "Recency_Scaled", "Frequency_Scaled", "Monetary_Scaled",
+    "Cluster", "Cluster_Label", "Customer_Type",
+]
+FORMATS = {
+    "csv": ("text/csv", ".csv"),
+    "parquet": ("application/vnd.apache.parquet", ".parquet"),
+}
+
+
+def file_stem(*parts) -> str:
+    """File name stem like ``segmen_regular_customer_jaya`` from the filter state."""
+    words = " ".join(str(part) for part in parts if part).lower()
+    return re.sub(r"[^a-z0-9]+", "_", words).strip("_")
+
+
+def iter_frames(df: pd.DataFrame, positions: np.ndarray = None, columns=EXPORT_COLUMNS,
+                chunk_rows: int = CHUNK_ROWS):
+    """Yield the selected rows of ``df`` as frames of at most ``chunk_rows`` rows."""
+    # Proyeksi kolom sekali saja; ``df[columns]`` menyalin seluruh frame
+    projected = df[[column for column in columns if column in df.columns]]
+    n_rows = len(df) if positions is None else len(positions)
+    for start in range(0, max(n_rows, 1), chunk_rows):
+        if positions is None:
+            yield projected.iloc[start:start + chunk_rows]
+        else:
+            yield projected.take(positions[start:start + chunk_rows])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only sink that hands out what was written since the last ``drain``.
+
+    ``tell`` keeps counting across drains, so Parquet footer offsets stay correct.
+    The Arrow writers take it as a Python file object.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data, self.parts = b"".join(self.parts), []
+        return data
+
+
+def _iter_arrow(open_writer, df, positions, columns, chunk_rows):
+    sink = _ChunkSink()
+    writer = None
+    for frame in iter_frames(df, positions, columns, chunk_rows):
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if writer is None:
+            writer = open_writer(sink, table.schema)
+        writer.write_table(table)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def iter_csv(df: pd.DataFrame, positions: np.ndarray = None, columns=EXPORT_COLUMNS,
+             chunk_rows: int = CHUNK_ROWS):
+    """UTF-8 CSV bytes of the selected rows, one chunk at a time (header in the first chunk)."""
+    import pyarrow.csv as pa_csv
+
+    return _iter_arrow(pa_csv.CSVWriter, df, positions, columns, chunk_rows)
+
+
+def iter_parquet(df: pd.DataFrame, positions: np.ndarray = None, columns=EXPORT_COLUMNS,
+                 chunk_rows: int = CHUNK_ROWS):
+    """Parquet bytes of the selected rows; every chunk becomes one row group."""
+    import pyarrow.parquet as pq
+
+    return _iter_arrow(lambda sink, schema: pq.ParquetWriter(sink, schema, compression="zstd"),
+                       df, positions, columns, chunk_rows)
+
+
+def iter_export(fmt: str, df: pd.DataFrame, positions: np.ndarray = None, columns=EXPORT_COLUMNS,
+                chunk_rows: int = CHUNK_ROWS):
+    if fmt not in FORMATS:
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt}")
+    iterate = iter_csv if fmt == "csv" else iter_parquet
+    return iterate(df, positions, columns, chunk_rows)
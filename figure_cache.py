@@ -0,0 +1,94 @@
+"""Cache figure Plotly yang sudah jadi, dipakai bersama antar rerun dan sesi.
+
+Figure disimpan sebagai JSON dengan kunci ``(versi data, ID chart,
+parameter filter)``. Saat cache hit, JSON dibuka kembali menjadi
+``go.Figure`` tanpa validasi, sehingga konstruksi Plotly Express dan
+validasi properti tidak diulang. Total ukuran JSON dibatasi ``max_bytes``
+dengan eviction LRU. Bila diberi ``store`` (mis. ``DiskCache``), JSON juga
+disimpan di sana sehingga restart server tidak membangun ulang figure.
+"""
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def figure_from_json(payload: str) -> go.Figure:
+    """Rebuild a finished figure without re-running Plotly's property validation."""
+    return go.Figure(json.loads(payload), _validate=False)
+
+
+class FigureCache:
+    """Thread-safe LRU of figure JSON strings bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, store=None):
+        self.max_bytes = max_bytes
+        self.store = store
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def size_of(self, key) -> int:
+        """Payload size in bytes of ``key`` (``None`` when not cached); does not touch the LRU order."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return None if entry is None else entry[1]
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, payload: str):
+        size = len(payload.encode())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (payload, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+
+    def discard(self, predicate) -> int:
+        """Drop every entry whose key matches ``predicate``; returns how many were dropped."""
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                self.size_bytes -= self._entries.pop(key)[1]
+        return len(stale)
+
+    def get_or_build(self, key, build) -> go.Figure:
+        """Cached figure for ``key``; ``build()`` runs only on a miss."""
+        payload = self.get(key)
+        if payload is None and self.store is not None:
+            payload = self.store.get(("figure", key))
+            if payload is not None:
+                self.put(key, payload)
+        if payload is not None:
+            return figure_from_json(payload)
+        with self._lock:
+            self.misses += 1
+        fig = build()
+        payload = fig.to_json()
+        self.put(key, payload)
+        if self.store is not None:
+            self.store.put(("figure", key), payload)
+        return fig
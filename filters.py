@@ -0,0 +1,72 @@
+"""Filter cluster + pencarian berbasis bitmap dan array posisi.
+
+Bitmap boolean dan array posisi per cluster dihitung sekali per versi
+data. Filter hanya menghasilkan array posisi baris (hasil AND antara
+bitmap cluster dan hit pencarian); ``FilterView`` mengambil kolom yang
+dibutuhkan sebuah chart dari posisi tersebut, tanpa menyalin frame utuh.
+"""
+import numpy as np
+import pandas as pd
+
+
+class FilterEngine:
+    """Precomputed per-cluster bitmaps and position arrays over one frame."""
+
+    def __init__(self, labels: pd.Series):
+        codes, uniques = pd.factorize(labels)
+        self.codes = codes
+        self.n_rows = len(codes)
+        # Urutan kemunculan, sama seperti labels.unique()
+        self.labels = list(uniques)
+        self.bitmaps = {label: codes == i for i, label in enumerate(uniques)}
+        self.positions = {label: np.flatnonzero(bitmap) for label, bitmap in self.bitmaps.items()}
+
+    def select(self, cluster=None, hits: np.ndarray = None):
+        """Row positions for a cluster (``None`` = all) AND-ed with search ``hits``.
+
+        Returns ``None`` for the unfiltered case so callers can skip the gather.
+        The order of ``hits`` is kept, so ranked search results stay ranked.
+        """
+        if hits is None:
+            return None if cluster is None else self.positions.get(cluster, np.empty(0, dtype=np.intp))
+        if cluster is None:
+            return hits
+        bitmap = self.bitmaps.get(cluster)
+        return hits[:0] if bitmap is None else hits[bitmap[hits]]
+
+
+class FilterView:
+    """Read-only view of ``df`` restricted to row ``positions`` (``None`` = all rows)."""
+
+    def __init__(self, df: pd.DataFrame, engine: FilterEngine, positions: np.ndarray = None):
+        self.df = df
+        self.engine = engine
+        self.positions = positions
+
+    def __len__(self):
+        return self.engine.n_rows if self.positions is None else len(self.positions)
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def column(self, name: str) -> np.ndarray:
+        values = self.df[name].to_numpy()
+        return values if self.positions is None else values[self.positions]
+
+    def frame(self, columns) -> pd.DataFrame:
+        """Gather only ``columns`` of the selected rows."""
+        projected = self.df[list(columns)]
+        return projected if self.positions is None else projected.take(self.positions)
+
+    def by_cluster(self, cluster) -> "FilterView":
+        """Sub-view of one cluster, AND-ed with the current selection."""
+        if self.positions is None:
+            return FilterView(self.df, self.engine, self.engine.select(cluster))
+        return FilterView(self.df, self.engine, self.engine.select(cluster, self.positions))
+
+    def labels(self) -> list:
+        """Cluster labels present in the view, in first-appearance order."""
+        if self.positions is None:
+            return list(self.engine.labels)
+        return [self.engine.labels[code] for code in pd.unique(self.engine.codes[self.positions])]
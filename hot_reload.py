@@ -0,0 +1,197 @@
+"""Hot reload file data RFM tanpa restart server dan tanpa flush seluruh cache.
+
+``DataWatcher`` memeriksa file sumber (store Arrow, atau ketiga CSV bila
+store belum ada) di thread latar belakang. Perubahan ``mtime``/ukuran hanya
+memicu hitung hash isi; versi baru dimuat di thread itu juga, dibandingkan
+dengan versi lama per ``perusahaan``, lalu ditukar secara atomik. Sesi yang
+sedang berjalan tetap memakai ``DataState`` lamanya sampai rerun berikutnya.
+
+Setiap cluster punya token versi sendiri yang hanya berganti bila ada
+perusahaan di cluster itu yang ditambah, dihapus atau berubah, sehingga
+cache turunan per cluster (statistik, figure) untuk cluster lain tetap
+terpakai.
+"""
+import hashlib
+import logging
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import rfm_store
+
+POLL_SECONDS = 5.0
+HASH_CHUNK_BYTES = 1 << 20
+
+logger = logging.getLogger(__name__)
+
+
+def source_paths(store_path: str = rfm_store.STORE_PATH) -> list:
+    """Files the dashboard data is loaded from (the store, else the CSVs).
+
+    Without a store only ``rfm_clustered.csv`` is loaded, but all three CSVs
+    are watched: the other two are checked against it on every load.
+    """
+    return [store_path] if os.path.exists(store_path) else list(rfm_store.CSV_FILES.values())
+
+
+def stat_signature(paths) -> tuple:
+    """Cheap change detector: size and mtime of each path."""
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((path, st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def content_hash(paths) -> str:
+    """Data version token from the file contents (a touched but unchanged file keeps its version)."""
+    digest = hashlib.sha1()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class DataDiff:
+    """Companies added, removed or changed between two versions, and the clusters they touch."""
+
+    def __init__(self, added, removed, changed, clusters):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.clusters = clusters
+
+    @property
+    def empty(self) -> bool:
+        return not (len(self.added) or len(self.removed) or len(self.changed))
+
+
+def diff_frames(old: pd.DataFrame, new: pd.DataFrame, key: str = "perusahaan",
+                label_column: str = "Cluster_Label") -> DataDiff:
+    """Row-level diff of two clustered frames joined on ``key``."""
+    old_keys = pd.Index(old[key].astype(str))
+    new_keys = pd.Index(new[key].astype(str))
+    pos = old_keys.get_indexer(new_keys)
+    hit = pos >= 0
+    old_rows, new_rows = pos[hit], np.flatnonzero(hit)
+
+    differs = np.zeros(len(new_rows), dtype=bool)
+    for column in old.columns.intersection(new.columns):
+        a = old[column].to_numpy()[old_rows]
+        b = new[column].to_numpy()[new_rows]
+        differs |= ~((a == b) | (pd.isna(a) & pd.isna(b)))
+    changed_rows = new_rows[differs]
+
+    removed = np.ones(len(old_keys), dtype=bool)
+    removed[old_rows] = False
+    old_labels = old[label_column].to_numpy()
+    new_labels = new[label_column].to_numpy()
+    # Perusahaan yang pindah cluster menyentuh cluster lama dan cluster barunya
+    clusters = set(old_labels[removed]) | set(old_labels[old_rows[differs]])
+    clusters |= set(new_labels[~hit]) | set(new_labels[changed_rows])
+    return DataDiff(new_keys[~hit], old_keys[removed], new_keys[changed_rows], clusters)
+
+
+class DataState:
+    """One loaded data version: its frames, per-cluster tokens and the diff from the previous one."""
+
+    def __init__(self, version: str, frames: tuple, cluster_versions: dict, diff: DataDiff = None):
+        self.version = version
+        self.frames = frames
+        self.cluster_versions = cluster_versions
+        self.diff = diff
+
+
+class DataWatcher:
+    """Polls the data files in a daemon thread and swaps in new versions atomically.
+
+    ``load(version)`` returns the frames of a version; ``diff_frame(frames)``
+    picks the clustered frame used for the per-company diff. Listeners are
+    called as ``listener(old_state, new_state)`` from the watcher thread
+    after each swap.
+    """
+
+    def __init__(self, load, diff_frame=lambda frames: frames[-1], paths=source_paths,
+                 interval: float = POLL_SECONDS, label_column: str = "Cluster_Label"):
+        self.load = load
+        self.diff_frame = diff_frame
+        self.paths = paths
+        self.interval = interval
+        self.label_column = label_column
+        self.state = None
+        self.error = None
+        self._signature = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def start(self) -> "DataWatcher":
+        """Load the current version synchronously, then keep watching in the background."""
+        try:
+            self.check()
+        except (FileNotFoundError, ValueError) as exc:
+            # File hilang atau CSV tidak konsisten: dicoba lagi oleh thread pada poll berikutnya
+            self.error = exc
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="rfm-data-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as exc:
+                # Versi lama tetap dipakai; dicoba lagi pada poll berikutnya
+                if repr(exc) != repr(self.error):
+                    logger.warning("Gagal memuat ulang data RFM: %s", exc)
+                self.error = exc
+
+    def check(self) -> bool:
+        """One poll; returns ``True`` when a new version was swapped in."""
+        with self._lock:
+            paths = self.paths()
+            signature = stat_signature(paths)
+            if signature == self._signature:
+                return False
+            version = content_hash(paths)
+            if self.state is not None and version == self.state.version:
+                self._signature = signature
+                return False
+            frames = self.load(version)
+            old = self.state
+            new = self._next_state(old, version, frames)
+            self.state = new
+            self.error = None
+            # File yang berubah lagi selama dimuat akan di-hash ulang pada poll berikutnya
+            if stat_signature(paths) == signature:
+                self._signature = signature
+        for listener in self._listeners:
+            listener(old, new)
+        return True
+
+    def _next_state(self, old: DataState, version: str, frames: tuple) -> DataState:
+        labels = self.diff_frame(frames)[self.label_column].unique()
+        if old is None:
+            return DataState(version, frames, {label: version for label in labels})
+        diff = diff_frames(self.diff_frame(old.frames), self.diff_frame(frames), label_column=self.label_column)
+        cluster_versions = {
+            label: old.cluster_versions[label]
+            if label in old.cluster_versions and label not in diff.clusters else version
+            for label in labels
+        }
+        return DataState(version, frames, cluster_versions, diff)
@@ -0,0 +1,197 @@
+"""Mini-batch K-Means (NumPy) untuk memperbarui kolom ``Cluster``.
+
+Centroid lama dipakai sebagai titik awal (warm start) sehingga pembaruan
+harian cukup beberapa mini-batch, bukan fit ulang penuh. Setelah fit,
+centroid baru dicocokkan ke centroid lama agar ID cluster (0 = Low,
+1 = Regular, 2 = High) tetap sama dan ``color_map`` di app.py tetap benar.
+
+Contoh::
+
+    python kmeans_engine.py --input rfm_clustered.csv --output rfm_clustered_baru.csv
+
+File yang sedang dibaca dashboard tidak boleh dijadikan ``--output``.
+"""
+import argparse
+import itertools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from rfm_store import is_live_file
+
+FEATURES = ["Recency_Scaled", "Frequency_Scaled", "Monetary_Scaled"]
+MODEL_PATH = "rfm_kmeans.json"
+
+# Nilai kolom Customer_Type di rfm_clustered.csv
+CUSTOMER_TYPES = {
+    0: "Low-Value Customer",
+    1: "Regular Customer",
+    2: "High-Value Customer",
+}
+
+
+def assign(X: np.ndarray, centroids: np.ndarray, batch_size: int = 65_536):
+    """Nearest-centroid labels and squared distances, computed in vectorized batches."""
+    labels = np.empty(len(X), dtype=np.int8 if len(centroids) <= 127 else np.int32)
+    distances = np.empty(len(X), dtype=np.float64)
+    c_sq = np.einsum("ij,ij->i", centroids, centroids)
+    for start in range(0, len(X), batch_size):
+        batch = X[start:start + batch_size]
+        d = np.einsum("ij,ij->i", batch, batch)[:, None] - 2.0 * batch @ centroids.T + c_sq
+        idx = d.argmin(axis=1)
+        labels[start:start + batch_size] = idx
+        distances[start:start + batch_size] = np.maximum(d[np.arange(len(batch)), idx], 0.0)
+    return labels, distances
+
+
+def centroids_from_labels(X: np.ndarray, labels: np.ndarray, n_clusters: int):
+    """Centroids and member counts of an existing labelling."""
+    counts = np.bincount(labels, minlength=n_clusters).astype(np.float64)
+    sums = np.zeros((n_clusters, X.shape[1]))
+    np.add.at(sums, labels, X)
+    centroids = sums / np.maximum(counts, 1.0)[:, None]
+    return centroids, counts
+
+
+def match_centroids(reference: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Permutation ``p`` so that ``centroids[p[i]]`` is closest to ``reference[i]``."""
+    k = len(reference)
+    cost = ((reference[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+    if k <= 8:
+        best = min(itertools.permutations(range(k)), key=lambda p: cost[np.arange(k), p].sum())
+        return np.array(best)
+    # Greedy untuk k besar: pasangan termurah lebih dulu
+    perm = np.full(k, -1)
+    used = set()
+    for flat in np.argsort(cost, axis=None):
+        i, j = divmod(int(flat), k)
+        if perm[i] < 0 and j not in used:
+            perm[i] = j
+            used.add(j)
+    return perm
+
+
+class MiniBatchKMeans:
+    """Mini-batch K-Means with optional warm start from previous centroids."""
+
+    def __init__(self, n_clusters: int = 3, batch_size: int = 4096, max_epochs: int = 20,
+                 tol: float = 1e-4, random_state: int = 0, init: np.ndarray = None,
+                 init_counts: np.ndarray = None):
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.max_epochs = max_epochs
+        self.tol = tol
+        self.rng = np.random.default_rng(random_state)
+        self.centroids = None if init is None else np.array(init, dtype=np.float64)
+        self.counts = None if init_counts is None else np.array(init_counts, dtype=np.float64)
+
+    def _init_centroids(self, X: np.ndarray):
+        # k-means++ pada sampel kecil
+        sample = X[self.rng.choice(len(X), size=min(len(X), 10_000), replace=False)]
+        centroids = [sample[self.rng.integers(len(sample))]]
+        for _ in range(1, self.n_clusters):
+            _, d = assign(sample, np.array(centroids))
+            centroids.append(sample[self.rng.choice(len(sample), p=d / d.sum())] if d.sum() else sample[0])
+        self.centroids = np.array(centroids)
+
+    def partial_fit(self, X: np.ndarray):
+        """One mini-batch update with per-centroid learning rates."""
+        if self.centroids is None:
+            self._init_centroids(X)
+        if self.counts is None:
+            self.counts = np.zeros(self.n_clusters)
+        labels, _ = assign(X, self.centroids)
+        batch_counts = np.bincount(labels, minlength=self.n_clusters).astype(np.float64)
+        sums = np.zeros_like(self.centroids)
+        np.add.at(sums, labels, X)
+        self.counts += batch_counts
+        seen = batch_counts > 0
+        self.centroids[seen] += (sums[seen] - batch_counts[seen, None] * self.centroids[seen]) / self.counts[seen, None]
+        return self
+
+    def fit(self, X: np.ndarray):
+        X = np.asarray(X, dtype=np.float64)
+        for _ in range(self.max_epochs):
+            previous = None if self.centroids is None else self.centroids.copy()
+            order = self.rng.permutation(len(X))
+            for start in range(0, len(X), self.batch_size):
+                self.partial_fit(X[order[start:start + self.batch_size]])
+            if previous is not None and np.abs(self.centroids - previous).max() < self.tol:
+                break
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return assign(np.asarray(X, dtype=np.float64), self.centroids)[0]
+
+    def inertia(self, X: np.ndarray) -> float:
+        return float(assign(np.asarray(X, dtype=np.float64), self.centroids)[1].sum())
+
+
+def save_model(model: MiniBatchKMeans, path: str = MODEL_PATH):
+    with open(path, "w") as f:
+        json.dump({
+            "features": FEATURES,
+            "centroids": model.centroids.tolist(),
+            "counts": model.counts.tolist(),
+        }, f, indent=2)
+
+
+def load_model(path: str = MODEL_PATH) -> MiniBatchKMeans:
+    with open(path) as f:
+        state = json.load(f)
+    centroids = np.array(state["centroids"])
+    return MiniBatchKMeans(n_clusters=len(centroids), init=centroids, init_counts=state["counts"])
+
+
+def refresh_clusters(df: pd.DataFrame, model: MiniBatchKMeans = None, max_epochs: int = 5):
+    """Re-segment ``df`` warm-started from ``model`` (or from its own ``Cluster`` column).
+
+    Rows without a ``Cluster`` value (new customers) are simply assigned. IDs
+    are kept stable by matching the refreshed centroids to the previous ones.
+    Warm-start counts are capped at ``len(df) / n_clusters`` so the previous
+    centroids weigh about one epoch of today's data; otherwise the saved
+    counts would grow on every refresh and freeze the centroids.
+    Returns ``(df_with_clusters, model)``.
+    """
+    X = df[FEATURES].to_numpy(dtype=np.float64)
+    if model is None:
+        known = df["Cluster"].notna().to_numpy() if "Cluster" in df else np.zeros(len(df), bool)
+        if not known.any():
+            raise ValueError("Tidak ada centroid sebelumnya: sertakan kolom 'Cluster' atau model tersimpan.")
+        labels = df.loc[known, "Cluster"].to_numpy().astype(np.int64)
+        centroids, counts = centroids_from_labels(X[known], labels, len(CUSTOMER_TYPES))
+        model = MiniBatchKMeans(n_clusters=len(centroids), init=centroids, init_counts=counts)
+
+    if model.counts is not None:
+        model.counts = np.minimum(model.counts, max(len(X) / model.n_clusters, 1.0))
+    previous = model.centroids.copy()
+    model.max_epochs = max_epochs
+    model.fit(X)
+    perm = match_centroids(previous, model.centroids)
+    model.centroids = model.centroids[perm]
+    model.counts = model.counts[perm]
+
+    df = df.copy()
+    df["Cluster"] = model.predict(X)
+    df["Customer_Type"] = df["Cluster"].map(CUSTOMER_TYPES)
+    return df, model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Perbarui kolom Cluster dengan mini-batch K-Means.")
+    parser.add_argument("--input", default="rfm_clustered.csv")
+    parser.add_argument("--output", default="rfm_clustered_baru.csv", help="file CSV hasil (default: %(default)s)")
+    parser.add_argument("--model", default=MODEL_PATH, help="centroid tersimpan (default: %(default)s)")
+    parser.add_argument("--epochs", type=int, default=5)
+    args = parser.parse_args()
+
+    if is_live_file(args.output):
+        parser.error(f"{args.output} sedang dipakai dashboard; tulis ke file lain lalu ganti secara manual")
+    data = pd.read_csv(args.input)
+    previous_model = load_model(args.model) if os.path.exists(args.model) else None
+    data, fitted = refresh_clusters(data, previous_model, max_epochs=args.epochs)
+    data.to_csv(args.output, index=False)
+    save_model(fitted, args.model)
+    print(data["Customer_Type"].value_counts().to_string())
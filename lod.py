@@ -0,0 +1,106 @@
+"""Level-of-detail untuk scatter 3D RFM pada jumlah pelanggan besar.
+
+Jika jumlah titik melebihi ``point_budget``, titik per cluster digabung ke
+grid voxel 3D; setiap voxel dikirim sebagai satu titik wakil (rata-rata
+posisi anggotanya) dengan ukuran sesuai jumlah anggota. Detail penuh hanya
+dikirim untuk hit pencarian. Voxel dan titik detail berbagi satu
+``point_budget``: bila ada hit, paling banyak separuh budget disisihkan
+untuk detail, dan hit yang melebihi sisanya diambil merata (stride).
+
+``customdata`` selalu berupa array float (Recency, Frequency, Monetary);
+nama perusahaan dikirim lewat ``hovertext``, bukan array ``object``.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+DEFAULT_POINT_BUDGET = 20_000
+DEFAULT_GRID = 24
+
+DETAIL_HOVER = (
+    "<b>Perusahaan: %{hovertext}</b><br><br>"
+    "<b>Cluster: %{fullData.name}</b><br>"
+    "Recency (Hari): %{customdata[0]:.0f}<br>"
+    "Frequency (Total): %{customdata[1]:.0f}<br>"
+    "Monetary (Rp): Rp %{customdata[2]:,.0f}<extra></extra>"
+)
+
+VOXEL_HOVER = (
+    "<b>%{customdata[0]:,} perusahaan</b><br>"
+    "<b>Cluster: %{fullData.name}</b><br>"
+    "contoh: %{hovertext}<br>"
+    "Rata-rata Recency (Hari): %{customdata[1]:.0f}<br>"
+    "Rata-rata Frequency: %{customdata[2]:.1f}<br>"
+    "Rata-rata Monetary (Rp): Rp %{customdata[3]:,.0f}<extra></extra>"
+)
+
+
+def voxel_bins(xyz: np.ndarray, raw: np.ndarray, grid: int = DEFAULT_GRID):
+    """Bin points on a ``grid``³ voxel grid over [0, 1]³.
+
+    Returns ``(centers, raw_means, counts, first)`` per occupied voxel, where
+    ``first`` is the position of one member used as the hover example.
+    """
+    cells = np.clip((xyz * grid).astype(np.int64), 0, grid - 1)
+    keys = (cells[:, 0] * grid + cells[:, 1]) * grid + cells[:, 2]
+    _, first, inverse, counts = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+    centers = np.column_stack([np.bincount(inverse, weights=xyz[:, i]) for i in range(3)]) / counts[:, None]
+    raw_means = np.column_stack([np.bincount(inverse, weights=raw[:, i]) for i in range(raw.shape[1])]) / counts[:, None]
+    return centers, raw_means, counts, first
+
+
+def detail_trace(xyz, raw, names, label, color, size=4) -> go.Scatter3d:
+    """One full-detail trace; ``raw`` holds Recency, Frequency, Monetary."""
+    return go.Scatter3d(
+        x=xyz[:, 0], y=xyz[:, 1], z=xyz[:, 2], mode="markers", name=label,
+        marker=dict(color=color, size=size), hovertext=names,
+        customdata=np.asarray(raw, dtype=np.float64), hovertemplate=DETAIL_HOVER,
+    )
+
+
+def scatter_3d_traces(xyz: np.ndarray, raw: np.ndarray, names: np.ndarray, labels: np.ndarray,
+                      color_map: dict, detail: np.ndarray = None,
+                      point_budget: int = DEFAULT_POINT_BUDGET, grid: int = DEFAULT_GRID) -> list:
+    """Traces for the 3D RFM scatter, one (or two, in LOD mode) per cluster.
+
+    ``detail`` holds row positions (e.g. search hits) that keep full detail
+    when the view is over budget. Voxels and detail points together stay
+    within ``point_budget``; hits beyond their share are sampled evenly.
+    """
+    label_order = list(dict.fromkeys(labels))
+    if len(xyz) <= point_budget:
+        return [
+            detail_trace(xyz[mask], raw[mask], names[mask], label, color_map.get(label), size=6)
+            for label in label_order
+            for mask in [labels == label]
+        ]
+
+    detail = np.empty(0, dtype=np.int64) if detail is None else np.asarray(detail)
+    # Budget voxel = sisa setelah jatah detail (maksimal separuh budget)
+    voxel_budget = point_budget - min(len(detail), point_budget // 2)
+    # Grid dikecilkan bila perlu agar jumlah voxel tetap di bawah voxel_budget
+    grid = min(grid, max(2, int((voxel_budget / len(label_order)) ** (1 / 3))))
+    traces = []
+    for label in label_order:
+        members = np.flatnonzero(labels == label)
+        centers, raw_means, counts, first = voxel_bins(xyz[members], raw[members], grid)
+        sizes = 3 + 15 * np.sqrt(counts / counts.max())
+        traces.append(go.Scatter3d(
+            x=centers[:, 0], y=centers[:, 1], z=centers[:, 2], mode="markers",
+            name=label, legendgroup=label,
+            marker=dict(color=color_map.get(label), size=sizes, opacity=0.7),
+            hovertext=names[members[first]],
+            customdata=np.column_stack([counts, raw_means]), hovertemplate=VOXEL_HOVER,
+        ))
+    detail_budget = max(point_budget - sum(len(trace.x) for trace in traces), 0)
+    if len(detail) > detail_budget:
+        # Sampel merata di seluruh hit, bukan N hit pertama
+        detail = detail[np.linspace(0, len(detail) - 1, detail_budget).astype(np.int64)]
+    if len(detail):
+        for label in label_order:
+            rows = detail[labels[detail] == label]
+            if len(rows):
+                trace = detail_trace(xyz[rows], raw[rows], names[rows], label, color_map.get(label), size=5)
+                trace.update(legendgroup=label, showlegend=False,
+                             marker=dict(line=dict(color="white", width=1)))
+                traces.append(trace)
+    return traces
@@ -0,0 +1,190 @@
+"""Tahap Isolation Forest untuk kolom ``IF_Score``, ``IF_Label`` dan ``Is_Outlier``.
+
+Pohon dibangun sekali dan disimpan ringkas sebagai array pohon biner
+lengkap (anak dari node ``i`` ada di ``2i+1`` dan ``2i+2``), jadi tidak ada
+objek per node. Panjang lintasan dihitung untuk seluruh batch baris dan
+seluruh pohon sekaligus dengan operasi array; batch besar dibagi ke
+process pool per chunk baris.
+
+Konvensi skor mengikuti ``IsolationForest.decision_function`` (scikit-learn)
+yang dipakai saat membuat ``rfm_tanpa_outlier.csv``: ``IF_Score`` positif
+untuk inlier, ``IF_Label`` 1/-1, ``Is_Outlier`` 0/1.
+
+Contoh::
+
+    python outlier.py --input rfm_minmax_scaled.csv --output rfm_tanpa_outlier_baru.csv
+
+File yang sedang dibaca dashboard tidak boleh dijadikan ``--output``; tinjau
+hasilnya lalu ganti file lama secara manual.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from rfm_store import is_live_file
+
+FEATURES = ["Recency", "Frequency", "Monetary"]
+FOREST_PATH = "rfm_iforest.npz"
+DEFAULT_CHUNK = 50_000
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def average_path_length(n) -> np.ndarray:
+    """c(n): expected path length of an unsuccessful BST search over ``n`` points."""
+    n = np.asarray(n, dtype=np.float64)
+    c = np.zeros_like(n)
+    c[n == 2] = 1.0
+    big = n > 2
+    c[big] = 2.0 * (np.log(n[big] - 1.0) + EULER_GAMMA) - 2.0 * (n[big] - 1.0) / n[big]
+    return c
+
+
+class IsolationForest:
+    """Isolation Forest stored as packed arrays of shape ``(n_trees, n_nodes)``.
+
+    ``feature`` is -1 on leaves, ``threshold`` holds split values and
+    ``leaf_depth`` the depth plus ``c(size)`` correction of each leaf.
+    """
+
+    def __init__(self, feature, threshold, leaf_depth, max_samples, offset=-0.5):
+        self.feature = feature
+        self.threshold = threshold
+        self.leaf_depth = leaf_depth
+        self.max_samples = int(max_samples)
+        self.offset = float(offset)
+
+    @property
+    def max_depth(self) -> int:
+        return int(np.log2(self.feature.shape[1] + 1)) - 1
+
+    @classmethod
+    def fit(cls, X: np.ndarray, n_trees: int = 100, max_samples: int = 256,
+            contamination="auto", random_state: int = 0):
+        X = np.asarray(X, dtype=np.float64)
+        rng = np.random.default_rng(random_state)
+        psi = min(max_samples, len(X))
+        max_depth = max(int(np.ceil(np.log2(max(psi, 2)))), 1)
+        n_nodes = 2 ** (max_depth + 1) - 1
+        feature = np.full((n_trees, n_nodes), -1, dtype=np.int8)
+        threshold = np.zeros((n_trees, n_nodes), dtype=np.float64)
+        leaf_depth = np.zeros((n_trees, n_nodes), dtype=np.float32)
+
+        for t in range(n_trees):
+            sample = X[rng.choice(len(X), size=psi, replace=False)]
+            stack = [(0, sample, 0)]
+            while stack:
+                node, rows, depth = stack.pop()
+                lo, hi = (rows.min(axis=0), rows.max(axis=0)) if len(rows) else (None, None)
+                splittable = np.flatnonzero(hi > lo) if len(rows) > 1 else np.array([], dtype=int)
+                if depth >= max_depth or len(splittable) == 0:
+                    leaf_depth[t, node] = depth + average_path_length([len(rows)])[0]
+                    continue
+                f = rng.choice(splittable)
+                split = rng.uniform(lo[f], hi[f])
+                feature[t, node] = f
+                threshold[t, node] = split
+                right = rows[:, f] >= split
+                stack.append((2 * node + 1, rows[~right], depth + 1))
+                stack.append((2 * node + 2, rows[right], depth + 1))
+
+        forest = cls(feature, threshold, leaf_depth, psi)
+        if contamination != "auto":
+            forest.offset = float(np.percentile(forest.score_samples(X), 100.0 * contamination))
+        return forest
+
+    def path_lengths(self, X: np.ndarray) -> np.ndarray:
+        """Mean path length per row, all trees traversed together level by level."""
+        X = np.asarray(X, dtype=np.float64)
+        n_trees = self.feature.shape[0]
+        trees = np.arange(n_trees)[:, None]
+        rows = np.arange(len(X))[None, :]
+        node = np.zeros((n_trees, len(X)), dtype=np.int32)
+        for _ in range(self.max_depth):
+            feat = self.feature[trees, node]
+            internal = feat >= 0
+            if not internal.any():
+                break
+            go_right = X[rows, np.maximum(feat, 0)] >= self.threshold[trees, node]
+            node = np.where(internal, 2 * node + 1 + go_right, node)
+        return self.leaf_depth[trees, node].mean(axis=0)
+
+    def score_samples(self, X: np.ndarray) -> np.ndarray:
+        """Negated anomaly score, as in scikit-learn (lower is more abnormal)."""
+        return -(2.0 ** (-self.path_lengths(X) / average_path_length([self.max_samples])[0]))
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        return self.score_samples(X) - self.offset
+
+    def save(self, path: str = FOREST_PATH):
+        np.savez_compressed(path, feature=self.feature, threshold=self.threshold,
+                            leaf_depth=self.leaf_depth, max_samples=self.max_samples, offset=self.offset)
+
+    @classmethod
+    def load(cls, path: str = FOREST_PATH):
+        with np.load(path) as data:
+            return cls(data["feature"], data["threshold"], data["leaf_depth"],
+                       data["max_samples"], data["offset"])
+
+
+# Forest per proses worker, diisi sekali oleh initializer pool
+_worker_forest = None
+
+
+def _init_worker(feature, threshold, leaf_depth, max_samples, offset):
+    global _worker_forest
+    _worker_forest = IsolationForest(feature, threshold, leaf_depth, max_samples, offset)
+
+
+def _score_chunk(X: np.ndarray) -> np.ndarray:
+    return _worker_forest.decision_function(X)
+
+
+def decision_scores(forest: IsolationForest, X: np.ndarray, n_jobs: int = None,
+                    chunk_size: int = DEFAULT_CHUNK) -> np.ndarray:
+    """``decision_function`` over ``X``, fanned out to a process pool for large inputs."""
+    X = np.asarray(X, dtype=np.float64)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs == 1 or len(X) <= chunk_size:
+        return np.concatenate([forest.decision_function(X[s:s + chunk_size])
+                               for s in range(0, len(X), chunk_size)] or [np.empty(0)])
+    chunks = [X[s:s + chunk_size] for s in range(0, len(X), chunk_size)]
+    initargs = (forest.feature, forest.threshold, forest.leaf_depth, forest.max_samples, forest.offset)
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=initargs) as pool:
+        return np.concatenate(list(pool.map(_score_chunk, chunks)))
+
+
+def apply_outlier_flags(df: pd.DataFrame, forest: IsolationForest, n_jobs: int = None) -> pd.DataFrame:
+    """Return ``df`` with fresh ``IF_Label``, ``IF_Score`` and ``Is_Outlier`` columns."""
+    scores = decision_scores(forest, df[FEATURES].to_numpy(dtype=np.float64), n_jobs=n_jobs)
+    df = df.copy()
+    df["IF_Label"] = np.where(scores < 0, -1, 1).astype(np.int8)
+    df["IF_Score"] = scores
+    df["Is_Outlier"] = (scores < 0).astype(np.int8)
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hitung ulang flag outlier Isolation Forest.")
+    parser.add_argument("--input", default="rfm_minmax_scaled.csv")
+    parser.add_argument("--output", default="rfm_tanpa_outlier_baru.csv",
+                        help="baris inlier saja (default: %(default)s)")
+    parser.add_argument("--forest", default=FOREST_PATH, help="forest tersimpan (default: %(default)s)")
+    parser.add_argument("--refit", action="store_true", help="bangun ulang pohon walau forest sudah ada")
+    parser.add_argument("--jobs", type=int, default=None, help="jumlah proses (default: semua core)")
+    args = parser.parse_args()
+
+    if is_live_file(args.output):
+        parser.error(f"{args.output} sedang dipakai dashboard; tulis ke file lain lalu ganti secara manual")
+    data = pd.read_csv(args.input)
+    if args.refit or not os.path.exists(args.forest):
+        model = IsolationForest.fit(data[FEATURES].to_numpy())
+        model.save(args.forest)
+    else:
+        model = IsolationForest.load(args.forest)
+    data = apply_outlier_flags(data, model, n_jobs=args.jobs)
+    data[data["Is_Outlier"] == 0].to_csv(args.output, index=False)
+    print(f"{int(data['Is_Outlier'].sum()):,} outlier dari {len(data):,} perusahaan")
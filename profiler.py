@@ -0,0 +1,129 @@
+"""Profiler hot path dashboard: waktu per bagian rerun, baris yang diproses dan ukuran payload.
+
+Setiap bagian (memuat data, filter, agregat, pembuatan figure, HTML tabel,
+serialisasi ``st.plotly_chart``) dibungkus ``Profiler.section``. Hasilnya:
+
+* disimpan per thread untuk rerun yang sedang berjalan (panel sidebar),
+* diringkas p50/p95 per bagian dari jendela terakhir di memori,
+* ditulis sebagai JSON lines ke log berotasi untuk dianalisis di bawah beban nyata.
+
+Ringkasan p50/p95 dari log (termasuk file hasil rotasi)::
+
+    python profiler.py logs/profile.jsonl
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+import numpy as np
+import pandas as pd
+
+LOG_PATH = os.environ.get("RFM_PROFILE_LOG", os.path.join("logs", "profile.jsonl"))
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+WINDOW = 1000
+
+
+class Timing:
+    """One measured section; ``rows`` and ``bytes`` can be filled in inside the block."""
+
+    def __init__(self, name: str, rows: int = None, nbytes: int = None):
+        self.name = name
+        self.rows = rows
+        self.bytes = nbytes
+        self.seconds = 0.0
+
+    def as_record(self) -> dict:
+        return {"section": self.name, "ms": round(self.seconds * 1000, 3), "rows": self.rows, "bytes": self.bytes}
+
+
+class Profiler:
+    """Section timer with a per-thread current run, an in-memory window and a rotating JSONL log."""
+
+    def __init__(self, log_path: str = LOG_PATH, max_bytes: int = LOG_MAX_BYTES,
+                 backup_count: int = LOG_BACKUPS, window: int = WINDOW):
+        self.log_path = log_path
+        self.window = window
+        self._durations = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._logger = None
+        if log_path:
+            os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+            handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger = logging.getLogger(f"{__name__}.{os.path.abspath(log_path)}")
+            self._logger.handlers[:] = [handler]
+            self._logger.setLevel(logging.INFO)
+            self._logger.propagate = False
+
+    def start_run(self, run_id: str = None):
+        """Begin a new rerun on this thread (clears its section list)."""
+        self._local.run_id = run_id
+        self._local.records = []
+
+    def run_records(self) -> list:
+        return list(getattr(self._local, "records", []))
+
+    def record(self, timing: Timing):
+        with self._lock:
+            self._durations[timing.name].append(timing.seconds)
+        record = timing.as_record()
+        if hasattr(self._local, "records"):
+            self._local.records.append(record)
+        if self._logger is not None:
+            self._logger.info(json.dumps({"ts": round(time.time(), 3), "run": getattr(self._local, "run_id", None),
+                                          **record}))
+
+    @contextmanager
+    def section(self, name: str, rows: int = None, nbytes: int = None):
+        timing = Timing(name, rows, nbytes)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.seconds = time.perf_counter() - start
+            self.record(timing)
+
+    def summary(self) -> pd.DataFrame:
+        """p50/p95 per section over the last ``window`` measurements of this process."""
+        with self._lock:
+            samples = {name: np.array(values) for name, values in self._durations.items() if values}
+        return percentile_table({name: values * 1000 for name, values in samples.items()})
+
+
+def percentile_table(samples_ms: dict) -> pd.DataFrame:
+    rows = [
+        (name, len(values), np.percentile(values, 50), np.percentile(values, 95), values.sum())
+        for name, values in samples_ms.items()
+    ]
+    table = pd.DataFrame(rows, columns=["section", "count", "p50_ms", "p95_ms", "total_ms"])
+    return table.sort_values("total_ms", ascending=False, ignore_index=True).round(3)
+
+
+def summarize_log(log_path: str = LOG_PATH) -> pd.DataFrame:
+    """p50/p95 per section from the log and its rotated backups."""
+    samples = defaultdict(list)
+    for path in glob.glob(f"{glob.escape(log_path)}*"):
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                samples[record["section"]].append(record["ms"])
+    return percentile_table({name: np.array(values) for name, values in samples.items()})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ringkas log profiler dashboard (p50/p95 per bagian).")
+    parser.add_argument("log", nargs="?", default=LOG_PATH)
+    args = parser.parse_args()
+    print(summarize_log(args.log).to_string(index=False))
@@ -0,0 +1,326 @@
+"""Laporan HTML statis "Analisis Deskriptif" dan "Analisis Clustering" untuk penonton read-only.
+
+Untuk satu ``Tanggal_Analisis`` (data aktif atau partisi di ``snapshots``),
+CLI ini merender halaman deskriptif dan setiap varian pilihan cluster di
+halaman clustering ("Semua" + per cluster) menjadi file HTML biasa yang bisa
+disajikan web server statis tanpa sesi Streamlit. Figure dibangun oleh
+``charts`` (tema ``PALETTE``/``plotly_dark_theme`` yang sama) di process
+pool, satu tugas per figure; figure yang sama di beberapa halaman hanya
+dirender sekali. Semua halaman memakai satu ``plotly.min.js`` bersama, dan
+daftar perusahaan per cluster disertakan sebagai CSV (``export``), bukan
+tabel HTML.
+
+Contoh::
+
+    python report.py --output report
+    python report.py --tanggal 2025-07-01 --output report/2025-07-01 --jobs 4
+"""
+import argparse
+import functools
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import charts
+import export
+import rfm_store
+import shared_data
+from aggregates import ClusterAggregates
+from distributions import summarize
+from filters import FilterEngine, FilterView
+from snapshots import SnapshotStore
+from tables import gold_html
+from theme import CUSTOM_CSS, PALETTE, RANKING_METRICS, SCATTER_POINT_BUDGET, TOP_K, cluster_names
+from topk import RankingIndex
+
+PLOTLY_JS = "plotly.min.js"
+ALL_CLUSTERS = "Semua"
+FIGURE_CONFIG = {"displaylogo": False, "responsive": True}
+
+# Tata letak halaman statis; gaya komponen (metric-box, custom-table, ...) dari CUSTOM_CSS
+REPORT_CSS = f"""
+<style>
+    body {{ background: {PALETTE["black"]}; color: {PALETTE["white_text"]}; font-family: 'Poppins', sans-serif;
+           max-width: 1400px; margin: 0 auto; padding: 1rem 2rem; }}
+    h3, h4 {{ color: {PALETTE["gold_mid"]}; }}
+    hr {{ border: 0; border-top: 1px solid {PALETTE["charcoal"]}; margin: 1.5rem 0; }}
+    a {{ color: {PALETTE["gold"]}; }}
+    .nav {{ display: flex; flex-wrap: wrap; gap: 0.5rem 1.5rem; padding: 0.75rem 0; }}
+    .nav a.active {{ font-weight: bold; text-decoration: none; }}
+    .row {{ display: flex; flex-wrap: wrap; gap: 1rem; }}
+    .row > div {{ flex: 1 1 300px; min-width: 0; }}
+    .caption {{ color: #A0A0A0; font-size: 0.9rem; }}
+</style>
+"""
+
+SCALED = ["Recency_Scaled", "Frequency_Scaled", "Monetary_Scaled"]
+VIOLINS = [
+    ("Recency_Scaled", "Recency (Scaled)", PALETTE["navy"]),
+    ("Frequency_Scaled", "Frequency (Scaled)", PALETTE["gold"]),
+    ("Monetary_Scaled", "Monetary (Scaled)", PALETTE["bronze"]),
+]
+TOP_BARS = [
+    ("Recency", f"Top {TOP_K} Recency (Hari Terendah)", PALETTE["navy"], True),
+    ("Frequency", f"Top {TOP_K} Total Frequency", PALETTE["gold"], False),
+    ("Monetary_Scaled", f"Top {TOP_K} Total Monetary", PALETTE["bronze"], False),
+]
+CLUSTER_BARS = [
+    ("Recency_Scaled", f"Top {TOP_K} Recency Terendah", PALETTE["navy"]),
+    ("Frequency_Scaled", f"Top {TOP_K} Frequency Tertinggi", PALETTE["gold"]),
+    ("Monetary_Scaled", f"Top {TOP_K} Monetary Tertinggi", PALETTE["bronze"]),
+]
+
+
+def load_clustered(date=None):
+    """``(Tanggal_Analisis, clustered frame with Cluster_Label)`` of the active data or a snapshot."""
+    table = shared_data.build_table(cluster_names)
+    current = pd.Timestamp(table["Tanggal_Analisis"][0].as_py())
+    if date is not None and pd.Timestamp(date) != current:
+        snapshot_store = SnapshotStore()
+        if pd.Timestamp(date) not in snapshot_store.dates():
+            available = ", ".join(f"{d:%Y-%m-%d}" for d in sorted(set(snapshot_store.dates()) | {current}))
+            raise ValueError(f"Tidak ada data untuk Tanggal_Analisis {date}; tersedia: {available}")
+        table = shared_data.build_table(cluster_names, snapshot_store.path(date))
+        current = pd.Timestamp(date)
+    return current, shared_data.to_frame(table, rfm_store.CLUSTERED_COLUMNS + ["Cluster_Label"])
+
+
+def page_name(cluster: str = None) -> str:
+    """File name of the descriptive page (``None``) or of one clustering variant."""
+    return "index.html" if cluster is None else f"{export.file_stem('clustering', cluster)}.html"
+
+
+def csv_name(cluster: str) -> str:
+    return f"{export.file_stem('segmen', cluster)}.csv"
+
+
+# Data per proses worker, diisi sekali oleh initializer pool
+_worker_df = None
+
+
+def _init_worker(df):
+    global _worker_df
+    _worker_df = df
+    for cached in (_engine, _aggregates, _rankings):
+        cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _engine() -> FilterEngine:
+    return FilterEngine(_worker_df["Cluster_Label"])
+
+
+@functools.lru_cache(maxsize=None)
+def _aggregates() -> ClusterAggregates:
+    return ClusterAggregates(_worker_df)
+
+
+@functools.lru_cache(maxsize=None)
+def _rankings() -> RankingIndex:
+    return RankingIndex(_worker_df, RANKING_METRICS)
+
+
+def _view(cluster: str) -> FilterView:
+    return FilterView(_worker_df, _engine(), _engine().select(None if cluster == ALL_CLUSTERS else cluster))
+
+
+def build_figure(chart_id: str, cluster: str = None, metric: str = None):
+    """Figure ``chart_id`` of the worker's data, matching the dashboard view that shows it."""
+    if chart_id == "pie_cluster":
+        return charts.pie_figure(_aggregates().counts())
+    if chart_id == "violin":
+        column, title, color = next(v for v in VIOLINS if v[0] == metric)
+        return charts.violin_chart(summarize(_worker_df[column].to_numpy()), title, color)
+    if chart_id == "top":
+        _, title, color, show_values = next(b for b in TOP_BARS if b[0] == metric)
+        return charts.ranking_bar(_rankings().top(metric, TOP_K), title, color, show_values=show_values)
+    if chart_id == "scatter_3d":
+        view = _view(cluster)
+        return charts.scatter_3d_figure(
+            xyz=np.column_stack([view.column(c) for c in SCALED]),
+            raw=np.column_stack([view.column(c) for c in ["Recency", "Frequency", "Monetary"]]).astype(np.float64),
+            names=view.column("perusahaan"),
+            labels=view.column("Cluster_Label"),
+            point_budget=SCATTER_POINT_BUDGET,
+        )
+    if chart_id == "heatmap_corr":
+        return charts.correlation_heatmap(
+            _aggregates().corr(clusters=None if cluster == ALL_CLUSTERS else [cluster]))
+    if chart_id == "hist":
+        title = f"Sebaran Cluster vs {metric.split('_')[0]}"
+        return charts.cluster_histogram(_view(cluster).frame(["Cluster_Label", metric]), metric, title)
+    if chart_id == "cluster_top":
+        _, title, color = next(b for b in CLUSTER_BARS if b[0] == metric)
+        return charts.cluster_ranking_bar(_rankings().top(metric, TOP_K, cluster), title, color)
+    raise ValueError(f"Figure tidak dikenal: {chart_id}")
+
+
+def _render_worker(key: tuple):
+    fig = build_figure(*key)
+    div_id = export.file_stem(*(part for part in key if part))
+    return key, fig.to_html(full_html=False, include_plotlyjs=False, div_id=div_id, config=FIGURE_CONFIG)
+
+
+def render_figures(df: pd.DataFrame, keys, n_jobs: int = None) -> dict:
+    """``key -> HTML div`` for every figure key, one process-pool task per figure."""
+    keys = list(dict.fromkeys(keys))
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(keys) or 1)
+    if n_jobs == 1:
+        _init_worker(df)
+        return dict(map(_render_worker, keys))
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(df,)) as pool:
+        return dict(pool.map(_render_worker, keys))
+
+
+def descriptive_keys() -> list:
+    return ([("pie_cluster", None, None)]
+            + [("violin", None, column) for column, _, _ in VIOLINS]
+            + [("top", None, metric) for metric, _, _, _ in TOP_BARS])
+
+
+def clustering_keys(cluster: str, labels: list) -> list:
+    members = labels if cluster == ALL_CLUSTERS else [cluster]
+    return ([("scatter_3d", cluster, None), ("heatmap_corr", cluster, None),
+             ("hist", cluster, "Frequency_Scaled"), ("hist", cluster, "Monetary_Scaled")]
+            # Top-k per cluster tidak bergantung pada pilihan cluster: dirender sekali untuk semua varian
+            + [("cluster_top", member, metric) for member in members for metric, _, _ in CLUSTER_BARS])
+
+
+def metric_boxes(items) -> str:
+    boxes = "".join(f"""
+        <div><div class="metric-box">
+            <div class="metric-value">{html.escape(value)}</div>
+            <div class="metric-label">{html.escape(label)}</div>
+        </div></div>""" for value, label in items)
+    return f'<div class="row">{boxes}</div>'
+
+
+def row(*cells) -> str:
+    return '<div class="row">' + "".join(f"<div>{cell}</div>" for cell in cells) + "</div>"
+
+
+def page_html(title: str, body: str, date: pd.Timestamp, nav: str) -> str:
+    return f"""<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)} · {date:%Y-%m-%d}</title>
+<script src="{PLOTLY_JS}"></script>
+{CUSTOM_CSS}
+{REPORT_CSS}
+</head>
+<body>
+<div class="dashboard-title">✨ Dashboard - PT. AJM Global Pratama ✨</div>
+<div class="nav">{nav}</div>
+<p class="caption">Snapshot Tanggal_Analisis {date:%Y-%m-%d} · laporan statis</p>
+{body}
+</body>
+</html>
+"""
+
+
+def navigation(labels: list, active: str) -> str:
+    links = [("Analisis Deskriptif", page_name())] + [
+        (f"Analisis Clustering: {cluster}", page_name(cluster)) for cluster in [ALL_CLUSTERS] + labels
+    ]
+    active_class = ' class="active"'
+    return "".join(f'<a href="{href}"{active_class if href == active else ""}>{html.escape(label)}</a>'
+                   for label, href in links)
+
+
+def descriptive_body(aggregates: ClusterAggregates, figures: dict, labels: list) -> str:
+    kpi, means = aggregates.combine(), aggregates.means()
+    downloads = " · ".join(f'<a href="{csv_name(cluster)}" download>{html.escape(cluster)}</a>'
+                           for cluster in [ALL_CLUSTERS] + labels)
+    return "".join([
+        "<h3>📊 Analisis Deskriptif Pelanggan</h3><hr>",
+        metric_boxes([
+            (f"{kpi.n:,}", "Total Pelanggan"),
+            (f"{round(means['Recency'], 2)} Hari", "Rata-rata Recency"),
+            (f"{round(means['Frequency'], 2)} Transaksi", "Rata-rata Frequency"),
+            (f"Rp {round(means['Monetary']):,}", "Rata-rata Monetary"),
+        ]),
+        "<hr>",
+        row("<h4>Distribusi Cluster Pelanggan 🥧</h4>" + figures[("pie_cluster", None, None)],
+            "<h4>Distribusi Recency, Frequency, Monetary📉</h4>"
+            + "".join(figures[("violin", None, column)] for column, _, _ in VIOLINS)),
+        "<hr><h3>🥇 Peringkat Perusahaan Berdasarkan Metrik RFM</h3>",
+        row(*(figures[("top", None, metric)] for metric, _, _, _ in TOP_BARS)),
+        "<hr><h3>📋 Data Perusahaan & Cluster</h3>",
+        f"<p>Unduh daftar perusahaan (CSV): {downloads}</p>",
+    ])
+
+
+def clustering_body(cluster: str, aggregates: ClusterAggregates, figures: dict, labels: list, n_rows: int) -> str:
+    members = labels if cluster == ALL_CLUSTERS else [cluster]
+    summary = aggregates.cluster_summary(clusters=None if cluster == ALL_CLUSTERS else [cluster])
+    parts = [
+        "<h3>🤖 Analisis Clustering RFM (K-Means)</h3><hr>",
+        f'<p class="caption">🧭 Cluster: <strong>{html.escape(cluster)}</strong> · {n_rows:,} perusahaan · '
+        f'<a href="{csv_name(cluster)}" download>⬇️ Unduh CSV</a></p>',
+        "<h3>🌌 Visualisasi 3D RFM Clustering</h3>", figures[("scatter_3d", cluster, None)], "<hr>",
+        "<h3>🔥 Heatmap Korelasi RFM</h3>", figures[("heatmap_corr", cluster, None)], "<hr>",
+        "<h3>📈 Ringkasan Cluster</h3>", gold_html(summary.reset_index()), "<hr>",
+        row(figures[("hist", cluster, "Frequency_Scaled")], figures[("hist", cluster, "Monetary_Scaled")]),
+        f"<hr><h3>🏆 Top {TOP_K} Perusahaan Berdasarkan Cluster & Metrik RFM</h3>",
+    ]
+    for member in members:
+        parts.append(f"<h4>{html.escape(member)}</h4>")
+        parts.append(row(*(figures[("cluster_top", member, metric)] for metric, _, _ in CLUSTER_BARS)))
+    return "".join(parts)
+
+
+def write_report(output: str, date=None, n_jobs: int = None) -> list:
+    """Render all pages for ``date`` (default: the active data) into ``output``; returns the written files."""
+    import plotly.offline
+
+    date, df = load_clustered(date)
+    os.makedirs(output, exist_ok=True)
+    engine, aggregates = FilterEngine(df["Cluster_Label"]), ClusterAggregates(df)
+    labels = [label for label in cluster_names.values() if label in engine.labels]
+
+    keys = descriptive_keys() + [key for cluster in [ALL_CLUSTERS] + labels for key in clustering_keys(cluster, labels)]
+    figures = render_figures(df, keys, n_jobs)
+
+    written = []
+
+    def write(name, content):
+        path = os.path.join(output, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        written.append(path)
+
+    write(PLOTLY_JS, plotly.offline.get_plotlyjs())
+    write(page_name(), page_html("Analisis Deskriptif", descriptive_body(aggregates, figures, labels),
+                                 date, navigation(labels, page_name())))
+    for cluster in [ALL_CLUSTERS] + labels:
+        positions = None if cluster == ALL_CLUSTERS else engine.positions[cluster]
+        n_rows = len(df) if positions is None else len(positions)
+        write(page_name(cluster), page_html(f"Analisis Clustering: {cluster}",
+                                            clustering_body(cluster, aggregates, figures, labels, n_rows),
+                                            date, navigation(labels, page_name(cluster))))
+        path = os.path.join(output, csv_name(cluster))
+        with open(path, "wb") as f:
+            for chunk in export.iter_csv(df, positions):
+                f.write(chunk)
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render laporan HTML statis dashboard RFM.")
+    parser.add_argument("--tanggal", default=None, help="Tanggal_Analisis (YYYY-MM-DD); default: data aktif")
+    parser.add_argument("--output", default="report", help="direktori keluaran (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=None, help="jumlah proses (default: semua core)")
+    args = parser.parse_args()
+
+    try:
+        files = write_report(args.output, args.tanggal, args.jobs)
+    except ValueError as exc:
+        parser.error(str(exc))
+    size = sum(os.path.getsize(path) for path in files)
+    print(f"{len(files)} file ({size / 1024 / 1024:.1f} MB) ditulis ke {args.output}")
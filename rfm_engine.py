@@ -0,0 +1,149 @@
+"""Menghitung Recency/Frequency/Monetary langsung dari ledger transaksi mentah.
+
+Ledger (CSV atau Parquet) dibaca per chunk sehingga memori hanya sebanding
+dengan jumlah perusahaan, bukan jumlah baris transaksi. Setiap chunk
+diagregasi per perusahaan lalu digabung ke akumulator berjalan.
+
+``Frequency`` adalah jumlah baris ledger per perusahaan. Ledger tidak
+memiliki kolom nomor faktur, jadi satu faktur dengan beberapa baris item
+terhitung beberapa kali; gabungkan baris per faktur lebih dulu bila
+Frequency harus berarti jumlah faktur.
+
+Contoh::
+
+    python rfm_engine.py ledger.csv --output rfm_minmax_scaled_baru.csv
+
+File yang sedang dibaca dashboard tidak boleh dijadikan ``--output``.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from rfm_store import is_live_file
+
+DEFAULT_CHUNKSIZE = 1_000_000
+
+# Nama kolom ledger mentah
+LEDGER_COLUMNS = {
+    "company": "perusahaan",
+    "date": "tanggal",
+    "amount": "jumlah",
+}
+
+SCALED_COLUMNS = {
+    "Recency": "Recency_Scaled",
+    "Frequency": "Frequency_Scaled",
+    "Monetary": "Monetary_Scaled",
+}
+
+
+def iter_ledger_chunks(path: str, columns: dict = None, chunksize: int = DEFAULT_CHUNKSIZE):
+    """Yield ``(company, date, amount)`` chunks from a CSV or Parquet ledger."""
+    columns = columns or LEDGER_COLUMNS
+    usecols = [columns["company"], columns["date"], columns["amount"]]
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=usecols):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=usecols, chunksize=chunksize)
+
+
+def aggregate_chunk(chunk: pd.DataFrame, columns: dict = None) -> pd.DataFrame:
+    """Per-company partial aggregates of one ledger chunk."""
+    columns = columns or LEDGER_COLUMNS
+    days = pd.to_datetime(chunk[columns["date"]]).to_numpy().astype("datetime64[D]").astype(np.int64)
+    partial = pd.DataFrame({
+        "perusahaan": chunk[columns["company"]].to_numpy(),
+        "last_day": days,
+        "Frequency": np.ones(len(chunk), dtype=np.int64),
+        "Monetary": chunk[columns["amount"]].to_numpy(),
+    })
+    return partial.groupby("perusahaan", sort=False).agg(
+        {"last_day": "max", "Frequency": "sum", "Monetary": "sum"}
+    )
+
+
+def merge_partials(acc: pd.DataFrame, partial: pd.DataFrame) -> pd.DataFrame:
+    """Combine two partial aggregates; max/sum are associative so order does not matter."""
+    if acc is None:
+        return partial
+    return pd.concat([acc, partial]).groupby(level=0, sort=False).agg(
+        {"last_day": "max", "Frequency": "sum", "Monetary": "sum"}
+    )
+
+
+def scale_values(values: np.ndarray, lo, hi) -> np.ndarray:
+    """Min-max scale ``values`` (broadcast over columns); a zero span scales to 0."""
+    values = np.asarray(values, dtype=np.float64)
+    lo, span = np.asarray(lo, dtype=np.float64), np.asarray(hi, dtype=np.float64) - lo
+    return np.where(span != 0, (values - lo) / np.where(span != 0, span, 1.0), 0.0)
+
+
+def minmax_scale(df: pd.DataFrame, bounds: dict = None) -> pd.DataFrame:
+    """Add the ``*_Scaled`` min-max columns; ``bounds`` maps column -> (min, max)."""
+    df = df.copy()
+    for column, scaled in SCALED_COLUMNS.items():
+        values = df[column].to_numpy(dtype=np.float64)
+        lo, hi = bounds[column] if bounds else (values.min(), values.max())
+        df[scaled] = scale_values(values, lo, hi)
+    return df
+
+
+def compute_rfm(path: str, analysis_date=None, columns: dict = None,
+                chunksize: int = DEFAULT_CHUNKSIZE) -> pd.DataFrame:
+    """Stream a ledger and return one RFM row per company.
+
+    ``analysis_date`` defaults to the day after the latest invoice, so the
+    most recent buyer gets Recency 1; an earlier date than the latest invoice
+    raises ``ValueError`` instead of producing negative Recency. ``Frequency``
+    counts ledger rows. The result carries ``Tanggal_Analisis`` and the
+    min-max ``*_Scaled`` columns used by the dashboard.
+    """
+    acc = None
+    for chunk in iter_ledger_chunks(path, columns, chunksize):
+        acc = merge_partials(acc, aggregate_chunk(chunk, columns))
+    if acc is None:
+        raise ValueError(f"Ledger {path} tidak memuat transaksi.")
+
+    last_day = acc["last_day"].to_numpy()
+    if analysis_date is None:
+        reference = last_day.max() + 1
+    else:
+        reference = np.datetime64(pd.Timestamp(analysis_date).date(), "D").astype(np.int64)
+        if reference < last_day.max():
+            latest = np.datetime64(int(last_day.max()), "D")
+            raise ValueError(f"Tanggal analisis {analysis_date} lebih awal dari transaksi terakhir ({latest}).")
+
+    df = pd.DataFrame({
+        "perusahaan": acc.index.to_numpy(),
+        "Recency": (reference - last_day).astype(np.int32),
+        "Frequency": acc["Frequency"].to_numpy().astype(np.int32),
+        "Monetary": acc["Monetary"].to_numpy(),
+    })
+    df = minmax_scale(df)
+    df["Tanggal_Analisis"] = pd.Timestamp(np.datetime64(int(reference), "D"))
+    return df.sort_values("perusahaan", kind="stable").reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hitung RFM dari ledger transaksi mentah.")
+    parser.add_argument("ledger", help="file ledger (.csv atau .parquet)")
+    parser.add_argument("--output", default="rfm_minmax_scaled_baru.csv", help="file CSV hasil (default: %(default)s)")
+    parser.add_argument("--tanggal-analisis", default=None, help="tanggal referensi Recency (YYYY-MM-DD)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.ledger):
+        parser.error(f"file ledger tidak ditemukan: {args.ledger}")
+    if is_live_file(args.output):
+        parser.error(f"{args.output} sedang dipakai dashboard; tulis ke file lain lalu ganti secara manual")
+    try:
+        result = compute_rfm(args.ledger, args.tanggal_analisis, chunksize=args.chunksize)
+    except ValueError as exc:
+        parser.error(str(exc))
+    result.to_csv(args.output, index=False)
+    print(f"{len(result):,} perusahaan ditulis ke {args.output}")
@@ -0,0 +1,154 @@
+"""Store kolumnar RFM: satu file Arrow IPC yang menggantikan tiga CSV.
+
+Semua kolom disimpan sekali, diurutkan dan unik per ``perusahaan``, dengan
+dtype ringkas. File ditulis tanpa kompresi sehingga bisa di-memory-map dan
+setiap halaman hanya membaca kolom yang benar-benar digambar.
+
+Konversi sekali jalan dari CSV yang ada::
+
+    python rfm_store.py
+"""
+import argparse
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+STORE_PATH = "rfm_store.arrow"
+
+CSV_FILES = {
+    "rfm": "rfm_tanpa_outlier.csv",
+    "norm": "rfm_minmax_scaled.csv",
+    "clustered": "rfm_clustered.csv",
+}
+
+# Kolom yang dulu ada di masing-masing CSV
+RFM_COLUMNS = ["perusahaan", "Recency", "Frequency", "Monetary", "IF_Label", "IF_Score", "Is_Outlier"]
+SCALED_COLUMNS = RFM_COLUMNS + ["Recency_Scaled", "Frequency_Scaled", "Monetary_Scaled"]
+CLUSTERED_COLUMNS = SCALED_COLUMNS + ["Cluster", "Customer_Type", "Tanggal_Analisis"]
+
+SCHEMA = pa.schema([
+    ("perusahaan", pa.dictionary(pa.int32(), pa.string())),
+    ("Recency", pa.int32()),
+    ("Frequency", pa.int32()),
+    ("Monetary", pa.int64()),
+    ("IF_Label", pa.int8()),
+    ("IF_Score", pa.float32()),
+    ("Is_Outlier", pa.int8()),
+    ("Recency_Scaled", pa.float32()),
+    ("Frequency_Scaled", pa.float32()),
+    ("Monetary_Scaled", pa.float32()),
+    ("Cluster", pa.int8()),
+    ("Customer_Type", pa.dictionary(pa.int8(), pa.string())),
+    ("Tanggal_Analisis", pa.date32()),
+])
+
+
+def is_live_file(path: str) -> bool:
+    """True if ``path`` is the store or one of the CSVs the dashboard reads."""
+    live = {os.path.abspath(p) for p in [STORE_PATH, *CSV_FILES.values()]}
+    return os.path.abspath(path) in live
+
+
+def data_version(path: str = STORE_PATH) -> str:
+    """Cheap version token of the data files (name, size and mtime of each)."""
+    paths = [path] if os.path.exists(path) else list(CSV_FILES.values())
+    parts = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+            parts.append(f"{p}:{st.st_size}:{st.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{p}:missing")
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:16]
+
+
+def frame_to_table(df: pd.DataFrame) -> pa.Table:
+    """Cast a clustered RFM frame to the compact store schema, keyed by ``perusahaan``."""
+    if df["perusahaan"].duplicated().any():
+        raise ValueError("Kolom 'perusahaan' harus unik di dalam store RFM.")
+    df = df.sort_values("perusahaan", kind="stable").reset_index(drop=True)
+    columns = {}
+    for field in SCHEMA:
+        values = df[field.name]
+        if pa.types.is_dictionary(field.type):
+            columns[field.name] = pa.array(values.astype(str), type=pa.string()).dictionary_encode().cast(field.type)
+        elif pa.types.is_date(field.type):
+            columns[field.name] = pa.array(pd.to_datetime(values).dt.date, type=field.type)
+        else:
+            columns[field.name] = pa.array(values.to_numpy(), type=field.type)
+    return pa.table(columns, schema=SCHEMA)
+
+
+def write_store(df: pd.DataFrame, path: str = STORE_PATH) -> str:
+    """Write ``df`` as an uncompressed Arrow IPC file (atomic replace)."""
+    table = frame_to_table(df)
+    tmp_path = f"{path}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    return path
+
+
+def check_consistency(df_clustered: pd.DataFrame, csv_files: dict = None):
+    """Raise ``ValueError`` unless the other two CSVs match ``df_clustered`` company by company.
+
+    ``rfm_clustered.csv`` already holds every column, so it is the only CSV
+    the data is read from; the other two must be copies of its columns.
+    """
+    csv_files = csv_files or CSV_FILES
+    base = df_clustered.set_index("perusahaan")
+    for name in ("rfm", "norm"):
+        other = pd.read_csv(csv_files[name]).set_index("perusahaan")
+        if other.index.duplicated().any() or set(other.index) != set(base.index):
+            raise ValueError(f"{csv_files[name]} tidak memuat perusahaan yang sama dengan {csv_files['clustered']}.")
+        other = other.reindex(base.index)
+        for column in other.columns.intersection(base.columns):
+            left, right = other[column], base[column]
+            if pd.api.types.is_numeric_dtype(left) and pd.api.types.is_numeric_dtype(right):
+                same = np.allclose(left.to_numpy(np.float64), right.to_numpy(np.float64), equal_nan=True)
+            else:
+                same = left.astype(str).equals(right.astype(str))
+            if not same:
+                raise ValueError(f"Kolom {column} di {csv_files[name]} berbeda dengan {csv_files['clustered']}; "
+                                 f"data dibaca dari {csv_files['clustered']}, perbarui ketiga CSV bersama.")
+
+
+def convert_csvs(csv_files: dict = None, path: str = STORE_PATH) -> str:
+    """One-shot converter from the three legacy CSVs to the columnar store."""
+    csv_files = csv_files or CSV_FILES
+    df_clustered = pd.read_csv(csv_files["clustered"])
+    check_consistency(df_clustered, csv_files)
+    return write_store(df_clustered, path)
+
+
+def open_store(path: str = STORE_PATH) -> pa.Table:
+    """Open the store memory-mapped; no column data is read until it is touched."""
+    source = pa.memory_map(path, "r")
+    return ipc.open_file(source).read_all()
+
+
+def read_columns(columns, path: str = STORE_PATH) -> pd.DataFrame:
+    """Read only ``columns`` from the memory-mapped store as a pandas DataFrame."""
+    table = open_store(path).select(list(columns))
+    return table.to_pandas(date_as_object=False)
+
+
+def load_frames(path: str = STORE_PATH):
+    """Return the ``(df_rfm, df_norm, df_clustered)`` projections used by app.py."""
+    table = open_store(path)
+    return tuple(
+        table.select(columns).to_pandas(date_as_object=False)
+        for columns in (RFM_COLUMNS, SCALED_COLUMNS, CLUSTERED_COLUMNS)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Konversi CSV RFM ke store Arrow kolumnar.")
+    parser.add_argument("--output", default=STORE_PATH, help="lokasi file store (default: %(default)s)")
+    args = parser.parse_args()
+    print(f"Store ditulis ke {convert_csvs(path=args.output)}")
@@ -0,0 +1,217 @@
+"""API HTTP lokal untuk menentukan segmen pelanggan dari nilai Recency/Frequency/Monetary mentah.
+
+CRM dapat menanyakan segmen sekumpulan perusahaan tanpa membuka sesi
+Streamlit. Model (batas min-max dan centroid per ``Cluster``) dibangun
+sekali dari dataset yang sama dengan dashboard, dibagi oleh semua thread
+worker, dan ditukar secara atomik saat ``DataWatcher`` memuat versi data
+baru. Satu batch = satu operasi NumPy tervektorisasi (skala min-max lalu
+centroid terdekat).
+
+Endpoint::
+
+    POST /score   {"Recency": [...], "Frequency": [...], "Monetary": [...]}
+                  atau [{"Recency": 10, "Frequency": 3, "Monetary": 1500000}, ...]
+    GET  /health  versi data, label cluster dan batas min-max
+
+Contoh::
+
+    python scoring_api.py --port 8600
+    curl -s localhost:8600/score -d '{"Recency": [5, 400], "Frequency": [20, 1], "Monetary": [3e8, 2e5]}'
+"""
+import argparse
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+import shared_data
+from hot_reload import DataWatcher
+from kmeans_engine import assign, centroids_from_labels
+from rfm_engine import SCALED_COLUMNS, scale_values
+from theme import cluster_names
+
+logger = logging.getLogger(__name__)
+
+RAW_COLUMNS = list(SCALED_COLUMNS)
+MAX_BATCH = 100_000
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class SegmentModel:
+    """Min-max bounds and cluster centroids of one data version; immutable once built."""
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray, centroids: np.ndarray, version: str = None):
+        self.lower = lower
+        self.upper = upper
+        self.centroids = centroids
+        self.version = version
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, version: str = None) -> "SegmentModel":
+        """Bounds of the raw columns and centroids of the ``Cluster`` labelling in ``df``."""
+        raw = df[RAW_COLUMNS].to_numpy(dtype=np.float64)
+        lower, upper = raw.min(axis=0), raw.max(axis=0)
+        scaled = scale_values(raw, lower, upper)
+        centroids, _ = centroids_from_labels(scaled, df["Cluster"].to_numpy(dtype=np.int64), len(cluster_names))
+        return cls(lower, upper, centroids, version)
+
+    def score(self, raw: np.ndarray):
+        """``(cluster ids, scaled values)`` of an ``(n, 3)`` Recency/Frequency/Monetary batch."""
+        scaled = scale_values(raw, self.lower, self.upper)
+        return assign(scaled, self.centroids)[0], scaled
+
+
+def parse_batch(payload) -> np.ndarray:
+    """``(n, 3)`` float array from a columnar object or a list of records."""
+    if isinstance(payload, dict):
+        columns = [payload.get(column) for column in RAW_COLUMNS]
+        if any(not isinstance(values, list) for values in columns):
+            raise ValueError(f"Kolom {', '.join(RAW_COLUMNS)} wajib berupa list.")
+        if len({len(values) for values in columns}) != 1:
+            raise ValueError("Panjang kolom Recency, Frequency dan Monetary harus sama.")
+        try:
+            raw = np.array(columns, dtype=np.float64).T
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Nilai Recency/Frequency/Monetary harus berupa angka.") from exc
+    elif isinstance(payload, list):
+        try:
+            rows = [[record[column] for column in RAW_COLUMNS] for record in payload]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Setiap record wajib memuat {', '.join(RAW_COLUMNS)}.") from exc
+        try:
+            raw = np.array(rows, dtype=np.float64).reshape(-1, len(RAW_COLUMNS))
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Nilai Recency/Frequency/Monetary harus berupa angka.") from exc
+    else:
+        raise ValueError("Body harus objek kolom atau list record JSON.")
+    if len(raw) > MAX_BATCH:
+        raise ValueError(f"Maksimal {MAX_BATCH:,} baris per batch.")
+    if not np.isfinite(raw).all():
+        raise ValueError("Nilai Recency/Frequency/Monetary harus berupa angka.")
+    return raw
+
+
+class ScoringService:
+    """Holds the current ``SegmentModel``; the watcher swaps in a new one per data version."""
+
+    def __init__(self, watcher: DataWatcher = None):
+        self.model = None
+        self.watcher = watcher or DataWatcher(lambda version: shared_data.load_shared(version, cluster_names))
+        self.watcher.subscribe(self._on_reload)
+
+    def _on_reload(self, old, new):
+        # Satu assignment: request yang sedang berjalan tetap memakai model lamanya
+        self.model = SegmentModel.from_frame(new.frames[2], new.version)
+        logger.info("Model segmen dimuat untuk versi data %s", new.version)
+
+    def start(self) -> "ScoringService":
+        self.watcher.start()
+        return self
+
+    def score(self, payload) -> dict:
+        model = self.model
+        if model is None:
+            raise LookupError("Data RFM belum dapat dimuat.")
+        clusters, scaled = model.score(parse_batch(payload))
+        return {
+            "version": model.version,
+            "Cluster": clusters.tolist(),
+            "Cluster_Label": [cluster_names[c] for c in clusters.tolist()],
+            **{SCALED_COLUMNS[column]: scaled[:, i].round(6).tolist() for i, column in enumerate(RAW_COLUMNS)},
+        }
+
+    def health(self) -> dict:
+        model = self.model
+        return {
+            "version": None if model is None else model.version,
+            "clusters": {str(k): v for k, v in cluster_names.items()},
+            "bounds": None if model is None else {
+                column: [float(model.lower[i]), float(model.upper[i])] for i, column in enumerate(RAW_COLUMNS)
+            },
+            "error": None if self.watcher.error is None else str(self.watcher.error),
+        }
+
+
+def make_handler(service: ScoringService):
+    class ScoringHandler(BaseHTTPRequestHandler):
+        # Keep-alive: klien CRM dapat memakai ulang koneksi untuk banyak batch
+        protocol_version = "HTTP/1.1"
+        # Header dan body ditulis terpisah; tanpa ini setiap respons kecil tertahan delayed ACK (~40 ms)
+        disable_nagle_algorithm = True
+
+        def _send(self, status: int, body: dict):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip("/") == "/health":
+                self._send(200 if service.model is not None else 503, service.health())
+            else:
+                self._send(404, {"error": f"Endpoint {self.path} tidak dikenal."})
+
+        def do_POST(self):
+            header = self.headers.get("Content-Length")
+            if header is None:
+                self.close_connection = True
+                self._send(411, {"error": "Header Content-Length wajib diisi."})
+                return
+            try:
+                length = int(header)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # Batas body tidak diketahui, jadi koneksi tidak bisa dipakai ulang
+                self.close_connection = True
+                self._send(400, {"error": f"Content-Length tidak valid: {header!r}."})
+                return
+            if length > MAX_BODY_BYTES:
+                self.close_connection = True
+                self._send(413, {"error": f"Body maksimal {MAX_BODY_BYTES // 1024 // 1024} MB."})
+                return
+            body = self.rfile.read(length)
+            if self.path.rstrip("/") != "/score":
+                self._send(404, {"error": f"Endpoint {self.path} tidak dikenal."})
+                return
+            try:
+                self._send(200, service.score(json.loads(body or b"null")))
+            except (ValueError, TypeError, json.JSONDecodeError) as exc:
+                self._send(400, {"error": str(exc)})
+            except LookupError as exc:
+                self._send(503, {"error": str(exc)})
+
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    return ScoringHandler
+
+
+def serve(host: str = "127.0.0.1", port: int = 8600) -> ThreadingHTTPServer:
+    """Load the model and return a threaded server bound to ``host:port`` (call ``serve_forever``)."""
+    service = ScoringService().start()
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API HTTP lokal untuk skor segmen RFM.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    httpd = serve(args.host, args.port)
+    print(f"Skor segmen RFM di http://{args.host}:{args.port}/score (versi data {httpd.service.model and httpd.service.model.version})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
@@ -0,0 +1,99 @@
+"""Indeks trigram untuk kotak pencarian nama perusahaan.
+
+Nama dinormalisasi (case-fold, tanda baca jadi spasi) lalu dipecah menjadi
+trigram; setiap trigram menyimpan posting list berupa posisi baris yang
+terurut. Pencarian substring cukup mengiris posting list dari trigram
+query, lalu memverifikasi kandidat yang tersisa. Query yang terlalu pendek
+untuk trigram ("pt", "a") dijawab ``str.contains`` tervektorisasi atas nama
+yang sudah di-fold. Mode toleran salah ketik
+mengurutkan baris berdasarkan kemiripan trigram (Jaccard).
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text: str) -> str:
+    """Case-fold and collapse punctuation, so "PT." and "pt" share trigrams."""
+    return _NON_ALNUM.sub(" ", str(text).casefold())
+
+
+def trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Case-insensitive substring and fuzzy search over a column of names."""
+
+    def __init__(self, names):
+        self.folded = [str(name).casefold() for name in names]
+        # Kolom string (Arrow) untuk query yang lebih pendek dari satu trigram
+        self.folded_series = pd.Series(self.folded, dtype="str")
+        grams, positions, sizes = [], [], np.zeros(len(self.folded), dtype=np.int32)
+        for pos, name in enumerate(self.folded):
+            name_grams = trigrams(normalize(name))
+            sizes[pos] = len(name_grams)
+            grams.extend(name_grams)
+            positions.extend([pos] * len(name_grams))
+
+        codes, uniques = pd.factorize(pd.Series(grams, dtype=object))
+        order = np.argsort(codes, kind="stable")
+        sorted_positions = np.asarray(positions, dtype=np.int32)[order]
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        self.postings = {
+            gram: sorted_positions[bounds[i]:bounds[i + 1]] for i, gram in enumerate(uniques)
+        }
+        self.sizes = sizes
+
+    def __len__(self):
+        return len(self.folded)
+
+    def search(self, query: str) -> np.ndarray:
+        """Sorted row positions whose name contains ``query`` (case-insensitive, literal)."""
+        needle = str(query).casefold()
+        if not needle:
+            return np.arange(len(self.folded), dtype=np.int32)
+        query_grams = trigrams(normalize(needle).strip())
+        if not query_grams:
+            # Query terlalu pendek untuk trigram: pencocokan substring tervektorisasi
+            return np.flatnonzero(self.folded_series.str.contains(needle, regex=False).to_numpy()).astype(np.int32)
+
+        lists = sorted((self.postings.get(gram) for gram in query_grams), key=lambda p: 0 if p is None else len(p))
+        if lists[0] is None:
+            return np.empty(0, dtype=np.int32)
+        candidates = lists[0]
+        for posting in lists[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if not len(candidates):
+                break
+        if len(needle) == 3 and needle.isalnum():
+            # Trigram alfanumerik tunggal: posting list sudah tepat, tanpa verifikasi
+            return candidates
+        return np.array([i for i in candidates if needle in self.folded[i]], dtype=np.int32)
+
+    def rank(self, query: str, limit: int = None, min_similarity: float = 0.5) -> np.ndarray:
+        """Row positions ordered by trigram similarity to ``query`` (typo tolerant).
+
+        A row scores by the share of query trigrams it contains; among equal
+        scores, names closer in length to the query (higher Jaccard) come first.
+        Every row above ``min_similarity`` is returned unless ``limit`` caps the
+        list; callers that filter further (cluster, export) must not pass one.
+        """
+        query_grams = trigrams(normalize(query).strip())
+        if not query_grams:
+            return self.search(query)[:limit]
+        hit_lists = [self.postings[gram] for gram in query_grams if gram in self.postings]
+        if not hit_lists:
+            return np.empty(0, dtype=np.int32)
+        hits = np.bincount(np.concatenate(hit_lists), minlength=len(self.folded))
+        candidates = np.flatnonzero(hits >= min_similarity * len(query_grams))
+        shared = hits[candidates]
+        jaccard = shared / (len(query_grams) + self.sizes[candidates] - shared)
+        score = shared + jaccard  # jaccard < 1, jadi hanya memecah skor yang sama
+        if limit is not None and len(candidates) > limit:
+            top = np.argpartition(-score, limit - 1)[:limit]
+            candidates, score = candidates[top], score[top]
+        return candidates[np.argsort(-score, kind="stable")].astype(np.int32)
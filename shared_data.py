@@ -0,0 +1,114 @@
+"""Dataset dasar read-only yang dibagi antar sesi Streamlit dan antar proses server.
+
+Dataset (termasuk kolom turunan ``Cluster_Label``) ditulis sekali per versi
+data sebagai file Arrow IPC di shared memory (``/dev/shm``). Setiap proses
+me-memory-map file yang sama, jadi halaman memorinya dipakai bersama oleh
+semua worker di mesin itu; kolom numerik diubah ke pandas tanpa salinan dan
+bersifat read-only. Di dalam satu proses, objek yang sama dipakai semua sesi
+lewat ``st.cache_resource`` (tanpa pickle per sesi seperti ``st.cache_data``).
+"""
+import glob
+import hashlib
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+import rfm_store
+
+SHARED_DIR = os.environ.get(
+    "RFM_SHARED_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+)
+# Namespace per deployment (direktori aplikasi), supaya dashboard lain di mesin yang sama tidak saling menghapus
+SHARED_PREFIX = "rfm_dashboard_{}_".format(
+    hashlib.sha1(os.path.dirname(os.path.abspath(__file__)).encode()).hexdigest()[:12]
+)
+ATTACH_ATTEMPTS = 3
+
+
+def shared_path(data_version: str) -> str:
+    return os.path.join(SHARED_DIR, f"{SHARED_PREFIX}{data_version}.arrow")
+
+
+def build_table(cluster_names: dict, store_path: str = rfm_store.STORE_PATH) -> pa.Table:
+    """Base table from the store (or the clustered CSV) plus ``Cluster_Label``.
+
+    Without a store all three frames come from ``rfm_clustered.csv``; the
+    other two CSVs are only checked against it (``rfm_store.check_consistency``),
+    so an edit to just one of them raises ``ValueError`` instead of being ignored.
+    """
+    if os.path.exists(store_path):
+        table = rfm_store.open_store(store_path)
+    else:
+        df_clustered = pd.read_csv(rfm_store.CSV_FILES["clustered"])
+        rfm_store.check_consistency(df_clustered)
+        table = rfm_store.frame_to_table(df_clustered)
+    labels = pa.DictionaryArray.from_arrays(
+        table["Cluster"].combine_chunks().cast(pa.int8()),
+        pa.array([cluster_names[i] for i in range(len(cluster_names))]),
+    )
+    return table.append_column("Cluster_Label", labels)
+
+
+def publish(table: pa.Table, data_version: str) -> str:
+    """Write ``table`` to shared memory for ``data_version`` (atomic, idempotent).
+
+    Files of older versions in this deployment's namespace are unlinked;
+    processes still mapping them keep their pages until they attach to the
+    new version.
+    """
+    path = shared_path(data_version)
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    for stale in glob.glob(os.path.join(SHARED_DIR, f"{SHARED_PREFIX}*.arrow")):
+        if stale != path:
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
+    return path
+
+
+def attach(data_version: str) -> pa.Table:
+    """Memory-map the shared table of ``data_version``; raises if it is not published."""
+    return ipc.open_file(pa.memory_map(shared_path(data_version), "r")).read_all()
+
+
+def to_frame(table: pa.Table, columns) -> pd.DataFrame:
+    """Read-only DataFrame over ``columns``; numeric columns stay zero-copy views."""
+    return table.select(list(columns)).to_pandas(split_blocks=True, date_as_object=False)
+
+
+def load_shared(data_version: str, cluster_names: dict, store=None):
+    """``(df_rfm, df_norm, df_clustered)`` backed by the shared table of ``data_version``.
+
+    The first process to ask for a version builds and publishes it; every
+    other process and session attaches to the same pages. With a ``store``
+    (e.g. ``DiskCache``) the built table survives reboots that clear ``/dev/shm``.
+    """
+    for attempt in range(ATTACH_ATTEMPTS):
+        if not os.path.exists(shared_path(data_version)):
+            if store is None:
+                table = build_table(cluster_names)
+            else:
+                table = store.get_or_build(("dataset", data_version, tuple(cluster_names.items())),
+                                           lambda: build_table(cluster_names))
+            publish(table, data_version)
+        try:
+            table = attach(data_version)
+            break
+        except FileNotFoundError as exc:
+            # Proses lain yang mem-publish versi berbeda menghapus file ini di antara exists() dan attach()
+            if attempt == ATTACH_ATTEMPTS - 1:
+                raise RuntimeError(f"Dataset bersama versi {data_version} terus terhapus saat dibuka.") from exc
+    return (
+        to_frame(table, rfm_store.RFM_COLUMNS),
+        to_frame(table, rfm_store.SCALED_COLUMNS),
+        to_frame(table, rfm_store.CLUSTERED_COLUMNS + ["Cluster_Label"]),
+    )
@@ -0,0 +1,135 @@
+"""Riwayat snapshot RFM per ``Tanggal_Analisis`` dan analitik migrasi cluster.
+
+Setiap snapshot disimpan sebagai partisi terpisah
+``snapshots/Tanggal_Analisis=YYYY-MM-DD/rfm_store.arrow`` (format store
+dari ``rfm_store``, terurut dan unik per ``perusahaan``), sehingga satu
+snapshot bisa dibuka (memory-mapped) tanpa menyentuh yang lain. Matriks
+transisi dan trajektori per pelanggan dihitung dengan join vektor lewat
+indeks ``perusahaan``, bukan loop per perusahaan.
+
+Contoh::
+
+    python snapshots.py add rfm_clustered.csv
+    python snapshots.py list
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+import rfm_store
+
+SNAPSHOT_ROOT = "snapshots"
+PARTITION_PREFIX = "Tanggal_Analisis="
+
+
+class SnapshotStore:
+    """Date-partitioned RFM snapshots under ``root``."""
+
+    def __init__(self, root: str = SNAPSHOT_ROOT):
+        self.root = root
+
+    def path(self, date) -> str:
+        day = pd.Timestamp(date).strftime("%Y-%m-%d")
+        return os.path.join(self.root, f"{PARTITION_PREFIX}{day}", rfm_store.STORE_PATH)
+
+    def dates(self) -> list:
+        """Snapshot dates, oldest first."""
+        if not os.path.isdir(self.root):
+            return []
+        days = [
+            name[len(PARTITION_PREFIX):] for name in os.listdir(self.root)
+            if name.startswith(PARTITION_PREFIX) and os.path.exists(os.path.join(self.root, name, rfm_store.STORE_PATH))
+        ]
+        return sorted(pd.Timestamp(day) for day in days)
+
+    def version(self, date) -> str:
+        """Version token of one partition (changes only when that snapshot is rewritten)."""
+        return rfm_store.data_version(self.path(date))
+
+    def add(self, df: pd.DataFrame) -> list:
+        """Write one partition per ``Tanggal_Analisis`` value in ``df``; returns the dates."""
+        written = []
+        for day, part in df.groupby(pd.to_datetime(df["Tanggal_Analisis"]).dt.normalize()):
+            path = self.path(day)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            rfm_store.write_store(part, path)
+            written.append(day)
+        return written
+
+    def load(self, date, columns=("perusahaan", "Cluster")) -> pd.DataFrame:
+        """Columns of one snapshot, memory-mapped from its own partition."""
+        return rfm_store.read_columns(list(columns), self.path(date))
+
+
+def align(keys: pd.Index, names) -> np.ndarray:
+    """Positions of ``names`` in ``keys`` (-1 when missing), via a hash join."""
+    return keys.get_indexer(pd.Index(np.asarray(names, dtype=object)))
+
+
+def transition_matrix(before: pd.DataFrame, after: pd.DataFrame, labels: dict) -> pd.DataFrame:
+    """Counts of companies moving from each cluster in ``before`` to each in ``after``.
+
+    Companies present in only one snapshot land in the "Baru" row or the
+    "Hilang" column.
+    """
+    k = len(labels)
+    before_names = pd.Index(before["perusahaan"].astype(str))
+    after_pos = align(before_names, after["perusahaan"].astype(str))
+    before_codes = np.asarray(before["Cluster"], dtype=np.int64)
+    after_codes = np.asarray(after["Cluster"], dtype=np.int64)
+
+    # Indeks k dipakai untuk "Baru" (baris) dan "Hilang" (kolom)
+    src = np.where(after_pos >= 0, before_codes[np.maximum(after_pos, 0)], k)
+    counts = np.bincount(src * (k + 1) + after_codes, minlength=(k + 1) * (k + 1)).reshape(k + 1, k + 1)
+    matched = np.zeros(len(before_names), dtype=bool)
+    matched[after_pos[after_pos >= 0]] = True
+    counts[:k, k] = np.bincount(before_codes[~matched], minlength=k)
+
+    names = [labels[i] for i in range(k)]
+    return pd.DataFrame(counts, index=names + ["Baru"], columns=names + ["Hilang"])
+
+
+def trajectories(snapshots: dict, companies=None) -> pd.DataFrame:
+    """Cluster of each company per snapshot date (wide table, ``<NA>`` when absent).
+
+    ``snapshots`` maps date -> frame with ``perusahaan`` and ``Cluster``.
+    """
+    frames = {pd.Timestamp(d): f for d, f in sorted(snapshots.items())}
+    if companies is None:
+        keys = pd.Index(sorted(set().union(*(f["perusahaan"].astype(str) for f in frames.values()))))
+    else:
+        keys = pd.Index([str(c) for c in companies])
+    result = {}
+    for date, frame in frames.items():
+        values = np.zeros(len(keys), dtype=np.int16)
+        missing = np.ones(len(keys), dtype=bool)
+        pos = align(keys, frame["perusahaan"].astype(str))
+        hit = pos >= 0
+        values[pos[hit]] = np.asarray(frame["Cluster"], dtype=np.int16)[hit]
+        missing[pos[hit]] = False
+        result[date.strftime("%Y-%m-%d")] = pd.arrays.IntegerArray(values, missing)
+    return pd.DataFrame(result, index=keys.rename("perusahaan"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kelola snapshot RFM per Tanggal_Analisis.")
+    parser.add_argument("--root", default=SNAPSHOT_ROOT)
+    sub = parser.add_subparsers(dest="command", required=True)
+    add_cmd = sub.add_parser("add", help="tambahkan snapshot dari CSV atau store Arrow")
+    add_cmd.add_argument("source", help="rfm_clustered.csv atau rfm_store.arrow")
+    sub.add_parser("list", help="tampilkan tanggal snapshot")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.root)
+    if args.command == "add":
+        if args.source.endswith(".arrow"):
+            data = rfm_store.read_columns(rfm_store.CLUSTERED_COLUMNS, args.source)
+        else:
+            data = pd.read_csv(args.source)
+        for day in store.add(data):
+            print(f"Snapshot {day:%Y-%m-%d} ditulis ke {store.path(day)}")
+    else:
+        for day in store.dates():
+            print(f"{day:%Y-%m-%d}")
@@ -0,0 +1,103 @@
+"""Tabel emas (``custom-table``) berhalaman untuk dataset besar.
+
+Hanya baris pada halaman yang terlihat yang dirender ke HTML. Urutan per
+kolom (argsort stabil) dihitung sekali lalu dipakai ulang, dan fragmen
+HTML per halaman disimpan di LRU. Satu ``PagedTable`` dibuat per versi
+data, jadi cache fragmennya otomatis ikut versi data; dengan ``store``
+(mis. ``DiskCache``) fragmen juga bertahan setelah restart, dengan kunci
+``store_key`` yang memuat versi data.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def gold_html(df: pd.DataFrame, index=False) -> str:
+    """HTML table with the gold ``custom-table`` class, without copying ``df``."""
+    return df.to_html(classes='custom-table', index=index, border=0, justify='center', na_rep='',
+                      header=[str(c) for c in df.columns])
+
+
+class PagedTable:
+    """Paginated, sortable HTML rendering of one DataFrame."""
+
+    def __init__(self, df: pd.DataFrame, page_size: int = DEFAULT_PAGE_SIZE, max_fragments: int = 256,
+                 store=None, store_key=None):
+        self.df = df
+        self.store = store
+        self.store_key = store_key
+        self.page_size = page_size
+        self.max_fragments = max_fragments
+        self._orders = {}
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def order(self, sort_column=None, ascending: bool = True, subset_key=None, subset_mask=None) -> np.ndarray:
+        """Row positions in display order, optionally restricted to ``subset_mask``.
+
+        Orders are cached by ``(sort_column, ascending, subset_key)``; the
+        full-table sort is computed once and each subset just filters it.
+        """
+        key = (sort_column, ascending, subset_key)
+        with self._lock:
+            cached = self._orders.get(key)
+        if cached is not None:
+            return cached
+        if subset_key is not None:
+            full = self.order(sort_column, ascending)
+            result = full[subset_mask[full]]
+        elif sort_column is None:
+            result = np.arange(len(self.df))
+        elif self.store is not None:
+            result = self.store.get_or_build(("page_order", self.store_key, sort_column, ascending),
+                                             lambda: self._sort(sort_column, ascending))
+        else:
+            result = self._sort(sort_column, ascending)
+        with self._lock:
+            self._orders[key] = result
+        return result
+
+    def _sort(self, sort_column, ascending: bool) -> np.ndarray:
+        values = self.df[sort_column]
+        # Kategori diurutkan berdasarkan nilainya, bukan kode kategorinya
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(str)
+        codes = pd.factorize(values, sort=True)[0]
+        # Kode rank padat: urutan turun tetap stabil untuk nilai yang sama
+        return np.argsort(codes if ascending else -codes, kind="stable")
+
+    def n_rows(self, **order_kwargs) -> int:
+        return len(self.order(**order_kwargs))
+
+    def n_pages(self, **order_kwargs) -> int:
+        return max(1, -(-self.n_rows(**order_kwargs) // self.page_size))
+
+    def page_html(self, page: int = 0, sort_column=None, ascending: bool = True,
+                  subset_key=None, subset_mask=None, columns=None) -> str:
+        """HTML of one page (0-based), rendered once and then served from the LRU."""
+        key = (page, sort_column, ascending, subset_key, tuple(columns) if columns else None)
+        with self._lock:
+            html = self._fragments.get(key)
+            if html is not None:
+                self._fragments.move_to_end(key)
+                return html
+        if self.store is not None:
+            html = self.store.get_or_build(("page_html", self.store_key, self.page_size, key),
+                                           lambda: self._render(page, sort_column, ascending, subset_key, subset_mask, columns))
+        else:
+            html = self._render(page, sort_column, ascending, subset_key, subset_mask, columns)
+        with self._lock:
+            self._fragments[key] = html
+            if len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+        return html
+
+    def _render(self, page, sort_column, ascending, subset_key, subset_mask, columns) -> str:
+        order = self.order(sort_column, ascending, subset_key, subset_mask)
+        rows = order[page * self.page_size:(page + 1) * self.page_size]
+        frame = self.df if columns is None else self.df[list(columns)]
+        return gold_html(frame.take(rows).reset_index(drop=True))
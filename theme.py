@@ -0,0 +1,213 @@
+"""Tema visual dashboard: CSS global, palet warna dan template Plotly gelap-emas."""
+
+CUSTOM_CSS = """
+    <style>
+    /* Global page tweaks */
+    body {
+        background: linear-gradient(to bottom right, #ffffff, #0d0d0d00);
+        color: #EAEAEA;
+        font-family: 'Poppins', sans-serif;
+    }
+
+    /* ******************** PENINGKATAN VISUAL BARU ******************** */
+    .stApp {
+        background-color: #0D0D0D; /* Memastikan background utama aplikasi gelap */
+    }
+
+    .dashboard-title {
+        font-size: 38px;
+        font-weight: 700;
+        text-align: center;
+        color: #F6C90E;
+        margin-top: -30px;
+        padding: 18px;
+        background: linear-gradient(90deg, rgba(40,40,40,0.9), rgba(10,10,10,0.8));
+        border-radius: 12px;
+        box-shadow: 0 6px 24px rgba(0,0,0,0.45);
+        border: 2px solid #F6C90E; /* BINGKAI EMAS */
+    }
+
+    .metric-box {
+        background-color: #1A1A1A; /* Sedikit lebih terang dari background utama */
+        padding: 18px;
+        border-radius: 12px;
+        box-shadow: 0 4px 16px rgba(0,0,0,0.8); /* Shadow yang lebih gelap */
+        text-align: center;
+        margin-bottom: 16px;
+        transition: transform 0.2s ease;
+        border: 1px solid rgba(246,201,14,0.3); /* Border Emas yang lebih jelas */
+    }
+    .metric-box:hover { 
+        transform: scale(1.02); 
+        box-shadow: 0 6px 20px rgba(246,201,14,0.15); /* Efek hover yang lebih elegan */
+    }
+
+    .metric-value {
+        font-size: 30px;
+        font-weight: 800;
+        color: #F6C90E;
+    }
+    .metric-label {
+        font-size: 14px;
+        color: #CFCFCF;
+    }
+
+    section[data-testid="stSidebar"] {
+        background-color: #121212 !important; /* Sidebar sedikit lebih terang */
+        border-right: 1px solid #333333;
+    }
+    /* Mengubah warna teks di seluruh sidebar */
+    section[data-testid="stSidebar"] {
+        color: white !important;
+    }
+
+    /* Mengubah warna teks pada semua elemen di dalam sidebar */
+    section[data-testid="stSidebar"] * {
+        color: white !important;
+    }
+    
+    .summary-box {
+        background-color: #1F1F1F; /* Warna yang berbeda dari background utama */
+        border-left: 5px solid #F6C90E; /* Menggunakan warna Emas utama */
+        padding: 18px;
+        border-radius: 10px;
+        font-size: 14px;
+        margin-top: 12px;
+        color: #DDD;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.5);
+    }
+
+    /* === GOLD + BLACK PREMIUM TABLE THEME (custom-table used for HTML tables) === */
+    .custom-table {
+        width: 100%;
+        border-collapse: collapse;
+        border-radius: 12px;
+        overflow: hidden;
+        background-color: #0D0D0D; /* Deep black */
+        color: #EAEAEA;
+        border: 1px solid #3A3A3A;
+        font-family: 'Poppins', sans-serif;
+        font-size: 13px;
+    }
+
+    /* 🔥 PERBAIKAN STICKY HEADER FINAL 🔥 */
+    .custom-table th {
+        background: linear-gradient(90deg, #D4A017, #F6C90E); /* Gradient Emas yang lebih halus */
+        color: #1B1B1B;
+        font-weight: 700;
+        padding: 10px;
+        text-align: center;
+        border-bottom: 2px solid #D4A017;
+        position: sticky; /* Membuat header tetap */
+        top: 0;          /* Menempel di bagian atas scroll-table */
+        z-index: 1000;    /* Z-index ditingkatkan agar tidak tertutup elemen Streamlit lain */
+    }
+
+    .custom-table td {
+        padding: 8px 12px;
+        border: 1px solid #262626;
+        color: #EAEAEA;
+    }
+
+    .custom-table tr:nth-child(odd) {
+        background-color: #121212;
+    }
+    .custom-table tr:nth-child(even) {
+        background-color: #1A1A1A;
+    }
+
+    .custom-table tr:hover {
+        background-color: rgba(246, 201, 14, 0.2); /* Efek hover lebih jelas */
+        transition: 0.15s ease-in-out;
+    }
+
+    /* Plot container tweaks - PENTING: Untuk memastikan Plotly mengikuti tema gelap */
+    .stPlotlyChart {
+         /* Memastikan semua plot berada dalam container yang konsisten */
+         border-radius: 10px;
+         background-color: #1A1A1A; 
+         padding: 10px;
+         box-shadow: 0 2px 10px rgba(0,0,0,0.7);
+         margin-bottom: 20px;
+    }
+    
+    /* MENYESUAIKAN TINGGI TABEL DAN SCROLL */
+    .scroll-table {
+        max-height: 500px; /* Ditingkatkan agar kedua tabel sejajar vertikal */
+        overflow-y: auto;
+        padding-right: 6px;
+        margin-bottom: 20px;
+        border: 1px solid #333;
+        border-radius: 10px;
+    }
+    
+    /* PERBAIKAN JUDUL: MENGATASI JUDUL BERTABRAKAN DI STREAMLIT */
+    [data-testid="stMarkdownContainer"] h4 {
+        margin-top: 15px !important;
+        margin-bottom: 10px !important;
+        padding-top: 0;
+        color: #F6C90E;
+    }
+    
+    /* CSS Khusus untuk selectbox di kolom tabel 2, agar tidak menggeser tabel RFM mentah */
+    [data-testid="stForm"] > div:nth-child(1) {
+        margin-bottom: 0px !important; 
+    }
+    
+    /* Mengatur judul section Streamlit untuk tema gelap */
+    [data-testid="stHeader"] {
+        background-color: transparent;
+    }
+    
+    </style>
+"""
+
+PALETTE = {
+    "gold": "#F6C90E",
+    "gold_mid": "#DDB308",
+    "bronze": "#A67C52",
+    "navy": "#1F3A5F",
+    "black": "#0D0D0D",
+    "charcoal": "#2E2E2E",
+    "white_text": "#EAEAEA",
+    "dark_bg": "#1A1A1A"
+}
+
+# ID di kolom Cluster -> label tampilan (Cluster_Label)
+cluster_names = {
+    0: "Low Value Customer",
+    1: "Regular Customer",
+    2: "High Value Customer"
+}
+
+# Jumlah perusahaan di setiap grafik peringkat
+TOP_K = 10
+# Di atas jumlah titik ini, scatter 3D memakai mode level-of-detail (voxel)
+SCATTER_POINT_BUDGET = 20_000
+
+# Metrik peringkat: True = nilai terkecil terbaik
+RANKING_METRICS = {
+    "Recency": True,
+    "Frequency": False,
+    "Recency_Scaled": True,
+    "Frequency_Scaled": False,
+    "Monetary_Scaled": False,
+}
+
+color_map = {
+    "Low Value Customer": PALETTE["navy"],
+    "Regular Customer": PALETTE["gold"],
+    "High Value Customer": PALETTE["bronze"]
+}
+
+# Membuat template Plotly 
+plotly_dark_theme = dict(
+    font=dict(color=PALETTE["white_text"], family="Poppins"),
+    plot_bgcolor=PALETTE["dark_bg"],
+    paper_bgcolor=PALETTE["dark_bg"],
+    title_font=dict(size=20, color=PALETTE["gold_mid"]),
+    xaxis=dict(showgrid=True, gridcolor=PALETTE["charcoal"], zerolinecolor=PALETTE["charcoal"], tickfont=dict(color=PALETTE["white_text"]), title_font=dict(color=PALETTE["white_text"])),
+    yaxis=dict(showgrid=True, gridcolor=PALETTE["charcoal"], zerolinecolor=PALETTE["charcoal"], tickfont=dict(color=PALETTE["white_text"]), title_font=dict(color=PALETTE["white_text"])),
+    legend=dict(font=dict(color=PALETTE["white_text"])),
+    colorway=[PALETTE["gold"], PALETTE["navy"], PALETTE["bronze"]]
+)
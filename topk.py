@@ -0,0 +1,91 @@
+"""Indeks top-k per metrik dan per cluster untuk grafik "Top 10".
+
+``perusahaan`` sudah unik per baris, jadi peringkat cukup memilih k baris
+terbaik tanpa groupby. Saat data dimuat, ``argpartition`` menyimpan
+``k_max`` posisi terbaik per grup (sudah terurut); query ``top(k)`` hanya
+memotong array itu. Indeks dibangun ulang per versi data (hot reload
+menghasilkan ``RankingIndex`` baru), jadi tidak ada pembaruan di tempat.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_K_MAX = 50
+
+
+def top_k_positions(keys: np.ndarray, k: int, candidates: np.ndarray = None) -> np.ndarray:
+    """Positions of the ``k`` smallest ``keys`` (ties by position), best first.
+
+    ``candidates`` restricts the search to a subset of positions.
+    """
+    if candidates is None:
+        candidates = np.arange(len(keys))
+    if len(candidates) > k:
+        part = np.argpartition(keys[candidates], k - 1)[:k]
+        # Sertakan semua nilai yang seri dengan batas agar tie-break konsisten
+        bound = keys[candidates[part]].max()
+        candidates = candidates[keys[candidates] <= bound]
+    order = np.lexsort((candidates, keys[candidates]))
+    return candidates[order][:k]
+
+
+class TopKIndex:
+    """Best ``k_max`` positions of one metric, overall and per group.
+
+    ``ascending=True`` ranks the smallest values first (e.g. Recency).
+    """
+
+    def __init__(self, values, groups=None, ascending: bool = False, k_max: int = DEFAULT_K_MAX):
+        self.ascending = ascending
+        self.k_max = k_max
+        self.keys = np.asarray(values, dtype=np.float64) * (1.0 if ascending else -1.0)
+        if groups is None:
+            self.group_codes, self.group_labels = np.zeros(len(self.keys), dtype=np.intp), []
+        else:
+            self.group_codes, uniques = pd.factorize(groups)
+            self.group_labels = list(uniques)
+        self.members = {None: np.arange(len(self.keys))}
+        for code, label in enumerate(self.group_labels):
+            self.members[label] = np.flatnonzero(self.group_codes == code)
+        self.tops = {group: top_k_positions(self.keys, k_max, members) for group, members in self.members.items()}
+
+    def top(self, k: int = 10, group=None) -> np.ndarray:
+        """Best ``k`` positions of ``group`` (``None`` = all rows), best first."""
+        if k > self.k_max:
+            self.k_max = k
+            self.tops = {g: top_k_positions(self.keys, k, m) for g, m in self.members.items()}
+        top = self.tops.get(group)
+        return np.empty(0, dtype=np.intp) if top is None else top[:k]
+
+    def values(self, positions: np.ndarray) -> np.ndarray:
+        return self.keys[positions] * (1.0 if self.ascending else -1.0)
+
+
+class RankingIndex:
+    """``TopKIndex`` per metric over one frame, grouped by ``group_column``."""
+
+    def __init__(self, df: pd.DataFrame, metrics: dict, group_column: str = "Cluster_Label",
+                 k_max: int = DEFAULT_K_MAX):
+        groups = df[group_column].to_numpy()
+        self.names = df["perusahaan"].astype(str).to_numpy()
+        self.values = {metric: df[metric].to_numpy() for metric in metrics}
+        self.indexes = {
+            metric: TopKIndex(df[metric].to_numpy(), groups, ascending=ascending, k_max=k_max)
+            for metric, ascending in metrics.items()
+        }
+
+    def top(self, metric: str, k: int = 10, group=None, candidates: np.ndarray = None) -> pd.Series:
+        """Top-``k`` ranking as a Series of values indexed by company name.
+
+        With ``candidates`` (e.g. search hits) the ranking is computed over
+        that subset by partial sort instead of the precomputed index.
+        """
+        index = self.indexes[metric]
+        if candidates is None:
+            positions = index.top(k, group)
+        else:
+            if group is not None:
+                code = index.group_labels.index(group)
+                candidates = candidates[index.group_codes[candidates] == code]
+            positions = top_k_positions(index.keys, k, np.asarray(candidates, dtype=np.intp))
+        return pd.Series(self.values[metric][positions], index=pd.Index(self.names[positions], name="perusahaan"),
+                         name=metric)
@@ -0,0 +1 @@
+"""Modul halaman dashboard; masing-masing mengekspor ``render(state)``."""
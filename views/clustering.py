@@ -0,0 +1,180 @@
+"""Halaman "Analisis Clustering": scatter 3D, korelasi, ringkasan dan top-k per cluster.
+
+Filter cluster dan pencarian beserta semua chart yang bergantung padanya
+berada dalam satu fragment, sehingga mengubah filter hanya menjalankan
+ulang bagian ini, bukan CSS, sidebar atau pemuatan data. Figure dibangun
+oleh ``charts`` hanya saat cache miss.
+"""
+import numpy as np
+import streamlit as st
+
+import charts
+from aggregates import STAT_COLUMNS, ClusterAggregates
+from dashboard import (SCATTER_POINT_BUDGET, TOP_K, export_buttons, get_aggregate_cache, get_aggregates,
+                       get_filter_engine, get_profiler, get_rankings, get_search_index, gold_table,
+                       plotly_chart_cached)
+from export import file_stem
+from filters import FilterView
+from theme import PALETTE
+
+
+def render(state):
+    st.subheader("🤖 Analisis Clustering RFM (K-Means)")
+    st.markdown("---")
+
+    filtered_section(state)
+
+
+@st.fragment
+def filtered_section(state):
+    df_clustered = state.frames[2]
+    col1, col2 = st.columns([2, 3])
+    with col1:
+        selected_cluster = st.selectbox(
+            "🧭 Pilih Cluster:",
+            ["Semua"] + list(df_clustered["Cluster_Label"].unique())
+        )
+    with col2:
+        search_query = st.text_input("🔍 Cari nama perusahaan:")
+        fuzzy_search = st.checkbox("Toleransi salah ketik", value=False)
+    
+    st.markdown("---") 
+
+    # Filter hanya menghasilkan posisi baris; setiap chart mengambil kolomnya sendiri
+    profiler = get_profiler()
+    with profiler.section("clustering.filter") as timing:
+        hits = None
+        if search_query:
+            search_index = get_search_index(df_clustered["perusahaan"], state.version)
+            if fuzzy_search:
+                hits = search_index.rank(search_query)
+            else:
+                hits = search_index.search(search_query)
+        filter_engine = get_filter_engine(df_clustered["Cluster_Label"], state.version)
+        view = FilterView(
+            df_clustered, filter_engine,
+            filter_engine.select(None if selected_cluster == "Semua" else selected_cluster, hits)
+        )
+        timing.rows = len(view)
+    with profiler.section("clustering.aggregates", rows=len(view)):
+        # Agregat: kombinasi cluster dari statistik per cluster, filter pencarian lewat LRU
+        if hits is None:
+            view_aggregates = get_aggregates(df_clustered, state.version, state.cluster_versions)
+            view_clusters = None if selected_cluster == "Semua" else [selected_cluster]
+        else:
+            view_aggregates = get_aggregate_cache(state.version).get(
+                (selected_cluster, search_query, fuzzy_search),
+                lambda: ClusterAggregates(view.frame(['Cluster_Label'] + STAT_COLUMNS))
+            )
+            view_clusters = None
+    # Kunci cache figure untuk state filter saat ini
+    filter_key = (selected_cluster, search_query, fuzzy_search) if hits is not None else (selected_cluster,)
+    # Tampilan satu cluster tanpa pencarian hanya bergantung pada cluster itu
+    view_version = state.cluster_versions.get(selected_cluster, state.version) if hits is None else state.version
+
+    st.caption(f"{len(view):,} perusahaan sesuai filter")
+    export_buttons(df_clustered, view.positions, ("clustering",) + filter_key, state.version,
+                   file_stem("segmen", selected_cluster, search_query))
+    st.markdown("---")
+
+    # 3D SCATTER
+    st.subheader("🌌 Visualisasi 3D RFM Clustering")
+
+    def build_scatter_3d():
+        # Di atas batas titik: konteks cluster dikirim sebagai voxel, detail hanya untuk hit pencarian
+        base = FilterView(df_clustered, filter_engine,
+                          filter_engine.select(None if selected_cluster == "Semua" else selected_cluster))
+        if len(base) <= SCATTER_POINT_BUDGET:
+            base, detail = view, None
+        elif hits is None:
+            detail = None
+        else:
+            detail = view.positions if base.positions is None else np.searchsorted(base.positions, view.positions)
+        return charts.scatter_3d_figure(
+            xyz=np.column_stack([base.column(c) for c in ['Recency_Scaled', 'Frequency_Scaled', 'Monetary_Scaled']]),
+            raw=np.column_stack([base.column(c) for c in ['Recency', 'Frequency', 'Monetary']]).astype(np.float64),
+            names=base.column('perusahaan'),
+            labels=base.column('Cluster_Label'),
+            detail=detail,
+            point_budget=SCATTER_POINT_BUDGET,
+        )
+    plotly_chart_cached("scatter_3d", filter_key, build_scatter_3d, version=view_version, use_container_width=False)
+    st.markdown("---") 
+    
+    # Heatmap
+    st.subheader("🔥 Heatmap Korelasi RFM")
+
+    def build_heatmap():
+        return charts.correlation_heatmap(view_aggregates.corr(clusters=view_clusters))
+    plotly_chart_cached("heatmap_corr", filter_key, build_heatmap, version=view_version, use_container_width=True)
+    
+    st.markdown("---") 
+
+    st.subheader("📈 Ringkasan Cluster")
+    
+    cluster_summary = view_aggregates.cluster_summary(clusters=view_clusters)
+    st.markdown(gold_table(cluster_summary.reset_index()), unsafe_allow_html=True)
+    
+    st.markdown("""
+        <div class="summary-box">
+            <p><strong>Ringkasan Metrik:</strong> Tabel ini menunjukkan nilai rata-rata <strong>Recency, Frequency, dan Monetary</strong> per cluster. Angka yang lebih **tinggi** pada Frequency dan Monetary, serta **lebih rendah** pada Recency (karena Recency yang diskalakan adalah kebalikan dari Recency mentah), menunjukkan cluster yang lebih bernilai. </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---") 
+    
+    # Histogram
+    col_clust_hist1, col_clust_hist2 = st.columns(2)
+
+    def build_histogram(column, title):
+        return charts.cluster_histogram(view.frame(['Cluster_Label', column]), column, title)
+
+    with col_clust_hist1:
+        plotly_chart_cached(
+            "hist_frequency", filter_key,
+            lambda: build_histogram('Frequency_Scaled', "Sebaran Cluster vs Frequency"),
+            version=view_version, use_container_width=True)
+    with col_clust_hist2:
+        plotly_chart_cached(
+            "hist_monetary", filter_key,
+            lambda: build_histogram('Monetary_Scaled', "Sebaran Cluster vs Monetary"),
+            version=view_version, use_container_width=True)
+
+    st.markdown("---") 
+
+    # Top 10 Perusahaan
+    st.subheader(f"🏆 Top {TOP_K} Perusahaan Berdasarkan Cluster & Metrik RFM")
+    rankings = get_rankings(df_clustered, state.version)
+    # Dengan filter pencarian, peringkat dihitung dari hit saja (partial sort)
+    ranking_candidates = view.positions if hits is not None else None
+    # Tanpa pencarian, peringkat per cluster tidak bergantung pada selectbox
+    ranking_key = (search_query, fuzzy_search, TOP_K) if hits is not None else (TOP_K,)
+    
+    def ranking_version(cluster):
+        # Tanpa pencarian, top-k satu cluster cukup di-cache per token versi cluster itu
+        return state.cluster_versions.get(cluster, state.version) if hits is None else state.version
+
+    for cluster in view.labels():
+        st.markdown(f"#### **{cluster}**")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            def build_top_r():
+                return charts.cluster_ranking_bar(rankings.top("Recency_Scaled", TOP_K, cluster, ranking_candidates),
+                                                  f"Top {TOP_K} Recency Terendah", PALETTE["navy"])
+            plotly_chart_cached(("cluster_top_recency", cluster), ranking_key, build_top_r,
+                                version=ranking_version(cluster), use_container_width=True)
+
+        with col2:
+            def build_top_f():
+                return charts.cluster_ranking_bar(rankings.top("Frequency_Scaled", TOP_K, cluster, ranking_candidates),
+                                                  f"Top {TOP_K} Frequency Tertinggi", PALETTE["gold"])
+            plotly_chart_cached(("cluster_top_frequency", cluster), ranking_key, build_top_f,
+                                version=ranking_version(cluster), use_container_width=True)
+
+        with col3:
+            def build_top_m():
+                return charts.cluster_ranking_bar(rankings.top("Monetary_Scaled", TOP_K, cluster, ranking_candidates),
+                                                  f"Top {TOP_K} Monetary Tertinggi", PALETTE["bronze"])
+            plotly_chart_cached(("cluster_top_monetary", cluster), ranking_key, build_top_m,
+                                version=ranking_version(cluster), use_container_width=True)
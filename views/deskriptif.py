@@ -0,0 +1,167 @@
+"""Halaman "Analisis Deskriptif": KPI, distribusi, peringkat dan tabel data.
+
+Modul ini baru diimpor saat menu dipilih. Figure dibangun oleh ``charts``
+hanya saat belum ada di cache. Tabel berhalaman dijalankan sebagai
+fragment: mengganti halaman, urutan atau filter cluster tabel hanya
+menjalankan ulang tabel itu, bukan chart di atasnya.
+"""
+import streamlit as st
+
+import charts
+from dashboard import (TOP_K, export_buttons, get_aggregates, get_distributions, get_filter_engine,
+                       get_paged_table, get_profiler, get_rankings, paged_table, plotly_chart_cached)
+from export import file_stem
+from theme import PALETTE
+
+
+@st.fragment
+def data_rfm_table(state, rfm_columns):
+    df_rfm = state.frames[0]
+    paged_table(get_paged_table(df_rfm, "data_rfm", state.version), "data_rfm", rfm_columns)
+
+
+@st.fragment
+def daftar_cluster_table(state):
+    df_clustered = state.frames[2]
+    selected_table_cluster = st.selectbox(
+        "Pilih Cluster untuk Ditampilkan:",
+        ["Semua"] + list(df_clustered["Cluster_Label"].unique()),
+        key="table_cluster_filter_deskriptif"
+    )
+
+    table_columns = ["perusahaan", "Cluster", "Cluster_Label"]
+    cluster_table = get_paged_table(df_clustered, "daftar_cluster", state.version)
+    if selected_table_cluster == "Semua":
+        subset_key, subset_mask = None, None
+    else:
+        subset_key = selected_table_cluster
+        subset_mask = get_filter_engine(df_clustered["Cluster_Label"], state.version).bitmaps[selected_table_cluster]
+
+    st.markdown(f"**Jumlah perusahaan ditampilkan: {cluster_table.n_rows(sort_column='Cluster', subset_key=subset_key, subset_mask=subset_mask)}**")
+    paged_table(cluster_table, "daftar_cluster", table_columns, default_sort="Cluster",
+                subset_key=subset_key, subset_mask=subset_mask)
+    export_positions = None if subset_key is None else get_filter_engine(
+        df_clustered["Cluster_Label"], state.version).positions[subset_key]
+    export_buttons(df_clustered, export_positions, ("daftar_cluster", selected_table_cluster), state.version,
+                   file_stem("daftar_cluster", selected_table_cluster))
+
+
+def render(state):
+    _, df_norm, df_clustered = state.frames
+    st.subheader("📊 Analisis Deskriptif Pelanggan")
+    st.markdown("---") 
+
+    # Metrics
+    with get_profiler().section("deskriptif.kpi") as timing:
+        aggregates = get_aggregates(df_clustered, state.version, state.cluster_versions)
+        kpi = aggregates.combine()
+        kpi_mean = aggregates.means()
+        timing.rows = kpi.n
+    colA, colB, colC, colD = st.columns(4)
+    with colA:
+        st.markdown(f"""
+        <div class="metric-box">
+            <div class="metric-value">{kpi.n:,}</div>
+            <div class="metric-label">Total Pelanggan</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with colB:
+        st.markdown(f"""
+        <div class="metric-box">
+            <div class="metric-value">{round(kpi_mean['Recency'], 2)} Hari</div>
+            <div class="metric-label">Rata-rata Recency</div> 
+        </div>
+        """, unsafe_allow_html=True)
+    with colC:
+        st.markdown(f"""
+        <div class="metric-box">
+            <div class="metric-value">{round(kpi_mean['Frequency'], 2)} Transaksi</div>
+            <div class="metric-label">Rata-rata Frequency</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with colD:
+        st.markdown(f"""
+        <div class="metric-box">
+            <div class="metric-value">Rp {round(kpi_mean['Monetary']):,}</div>
+            <div class="metric-label">Rata-rata Monetary</div> 
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---") 
+
+    # summary box
+    st.markdown("""
+        <div class="summary-box">
+            <p><strong>💡 Sekilas Tentang RFM:</strong> Analisis ini mengukur nilai pelanggan berdasarkan <strong>Recency</strong> (kapan terakhir kali pelanggan membeli), <strong>Frequency</strong> (seberapa sering pelanggan membeli), dan <strong>Monetary</strong> (berapa banyak uang yang dibelanjakan pelanggan). Data di bawah ini memberikan pandangan dasar sebelum dilakukan clustering.</p>
+        </div>
+    """, unsafe_allow_html=True)
+    st.write("")
+    
+    # pie chart dan violin 
+    col_plot1, col_plot2 = st.columns([1, 1])
+
+    with col_plot1:
+        st.markdown("#### Distribusi Cluster Pelanggan 🥧") 
+
+        def build_pie():
+            return charts.pie_figure(aggregates.counts())
+        plotly_chart_cached("pie_cluster", (), build_pie, state.version, use_container_width=True)
+    
+    with col_plot2:
+        st.markdown("#### Distribusi Recency, Frequency, Monetary📉") 
+
+        # KDE, kuartil & sampel titik dihitung di server, sekali per versi data (hanya saat figure belum di-cache)
+        for column, title, color, chart_id in [
+            ('Recency_Scaled', "Recency (Scaled)", PALETTE["navy"], "violin_recency"),          # 1. Recency
+            ('Frequency_Scaled', "Frequency (Scaled)", PALETTE["gold"], "violin_frequency"),    # 2. Frequency
+            ('Monetary_Scaled', "Monetary (Scaled)", PALETTE["bronze"], "violin_monetary"),     # 3. Monetary
+        ]:
+            def build_violin():
+                return charts.violin_chart(get_distributions(df_norm, state.version)[column], title, color)
+            plotly_chart_cached(chart_id, (), build_violin, state.version, use_container_width=True)
+
+    st.markdown("---")
+    st.subheader("🥇 Peringkat Perusahaan Berdasarkan Metrik RFM")
+
+    # 2. Bar Chart
+    col_bar1, col_bar2, col_bar3 = st.columns(3)
+
+    with col_bar1:
+        # Top 10 companies recency 
+        def build_top_recency():
+            return charts.ranking_bar(get_rankings(df_clustered, state.version).top('Recency', TOP_K),
+                                      f"Top {TOP_K} Recency (Hari Terendah)", PALETTE["navy"], show_values=True)
+        plotly_chart_cached("top_recency", (TOP_K,), build_top_recency, state.version, use_container_width=True)
+
+    with col_bar2:
+        # Top 10 Frequency
+        def build_top_frequency():
+            return charts.ranking_bar(get_rankings(df_clustered, state.version).top('Frequency', TOP_K),
+                                      f"Top {TOP_K} Total Frequency", PALETTE["gold"])
+        plotly_chart_cached("top_frequency", (TOP_K,), build_top_frequency, state.version, use_container_width=True)
+
+    with col_bar3:
+        # Top 10 Monetary
+        def build_top_monetary():
+            return charts.ranking_bar(get_rankings(df_clustered, state.version).top('Monetary_Scaled', TOP_K),
+                                      f"Top {TOP_K} Total Monetary", PALETTE["bronze"])
+        plotly_chart_cached("top_monetary", (TOP_K,), build_top_monetary, state.version, use_container_width=True)
+
+    st.markdown("---") 
+    st.subheader("📋 Data Perusahaan & Cluster")
+    
+    # 3. Tabel Data
+    col_tabel1, col_tabel2 = st.columns([1, 1])
+
+    with col_tabel1:
+        st.markdown("#### Data RFM")
+        # Pilih hanya kolom yang diminta: perusahaan, Recency, Frequency, Monetary
+        rfm_columns = ['perusahaan', 'Recency', 'Frequency', 'Monetary']
+        
+        # Tabel RFM: hanya halaman yang terlihat yang dirender
+        data_rfm_table(state, rfm_columns)
+    
+    with col_tabel2:
+        st.markdown("#### Daftar Cluster")
+        
+        daftar_cluster_table(state)
@@ -0,0 +1,45 @@
+"""Halaman "Diagnostik Cluster": bukti pemilihan k untuk segmentasi K-Means.
+
+Sweep k dan silhouette sampel dihitung oleh ``diagnostics`` sekali per
+versi data (process pool, lalu disimpan di cache memori dan disk), jadi
+halaman ini langsung tampil setelah perhitungan pertama.
+"""
+import streamlit as st
+
+import charts
+from dashboard import cluster_names, get_diagnostics, get_profiler, gold_table, plotly_chart_cached
+from diagnostics import DEFAULT_KS, SILHOUETTE_SAMPLE
+
+
+def render(state):
+    df_clustered = state.frames[2]
+    st.subheader("🩺 Diagnostik Kualitas Cluster")
+    st.markdown("---")
+
+    with st.spinner("Menghitung K-Means untuk setiap k..."), \
+            get_profiler().section("diagnostik.sweep", rows=len(df_clustered)):
+        sweep, current = get_diagnostics(df_clustered, state.version)
+
+    current_k = len(cluster_names)
+    for col, value, label in zip(st.columns(3),
+                                 [f"{current['k']}", f"{current['davies_bouldin']:.3f}", f"{current['silhouette']:.3f}"],
+                                 ["Jumlah Cluster Saat Ini", "Davies-Bouldin (↓)", "Silhouette Sampel (↑)"]):
+        with col:
+            st.markdown(f"""
+            <div class="metric-box">
+                <div class="metric-value">{value}</div>
+                <div class="metric-label">{label}</div>
+            </div>
+            """, unsafe_allow_html=True)
+    st.write("")
+
+    plotly_chart_cached("k_sweep", (DEFAULT_KS, SILHOUETTE_SAMPLE),
+                        lambda: charts.k_sweep_figure(sweep, current_k), state.version, use_container_width=True)
+
+    best_silhouette = int(sweep.loc[sweep["silhouette"].idxmax(), "k"])
+    best_db = int(sweep.loc[sweep["davies_bouldin"].idxmin(), "k"])
+    st.markdown(
+        f"Silhouette tertinggi pada **k = {best_silhouette}**, Davies-Bouldin terendah pada **k = {best_db}**. "
+        f"Silhouette dihitung pada sampel berstrata maksimal {SILHOUETTE_SAMPLE:,} pelanggan."
+    )
+    st.markdown(gold_table(sweep.round(4)), unsafe_allow_html=True)
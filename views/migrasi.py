@@ -0,0 +1,95 @@
+"""Halaman "Migrasi Cluster": matriks transisi antar snapshot dan trajektori pelanggan.
+
+Pemilih snapshot dan pencarian trajektori masing-masing berada dalam
+fragment sendiri, jadi mencari perusahaan tidak menggambar ulang matriks
+transisi, dan sebaliknya.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import charts
+from dashboard import TOP_K, cluster_names, get_search_index, get_snapshot, gold_table, plotly_chart_cached
+from snapshots import SnapshotStore, transition_matrix, trajectories
+
+
+def load_snapshot(state, snapshot_versions, date):
+    if date in snapshot_versions:
+        return get_snapshot(date, snapshot_versions[date])
+    return state.frames[2][["perusahaan", "Cluster"]]
+
+
+def render(state):
+    df_clustered = state.frames[2]
+    st.subheader("🔄 Migrasi Cluster Antar Snapshot")
+    st.markdown("---")
+
+    snapshot_store = SnapshotStore()
+    current_date = pd.Timestamp(df_clustered["Tanggal_Analisis"].iloc[0])
+    snapshot_versions = {date: snapshot_store.version(date) for date in snapshot_store.dates()}
+    # Data aktif ikut dihitung sebagai snapshot walau belum disimpan ke store snapshot
+    snapshot_dates = sorted(set(snapshot_versions) | {current_date})
+
+    if len(snapshot_dates) < 2:
+        st.info(
+            f"Baru ada satu snapshot ({current_date:%Y-%m-%d}). Simpan snapshot bulanan dengan "
+            "`python snapshots.py add rfm_clustered.csv` untuk melihat migrasi cluster."
+        )
+    else:
+        transition_section(state, snapshot_dates, snapshot_versions)
+
+        st.markdown("---")
+        st.markdown("#### Trajektori Pelanggan")
+        trajectory_section(state, snapshot_dates, snapshot_versions)
+
+
+@st.fragment
+def transition_section(state, snapshot_dates, snapshot_versions):
+    col_from, col_to = st.columns(2)
+    with col_from:
+        date_from = st.selectbox("Snapshot awal:", snapshot_dates[:-1], index=len(snapshot_dates) - 2,
+                                 format_func=lambda d: f"{d:%Y-%m-%d}")
+    with col_to:
+        later_dates = [d for d in snapshot_dates if d > date_from]
+        date_to = st.selectbox("Snapshot akhir:", later_dates, index=len(later_dates) - 1,
+                               format_func=lambda d: f"{d:%Y-%m-%d}")
+
+    snapshot_before = load_snapshot(state, snapshot_versions, date_from)
+    snapshot_after = load_snapshot(state, snapshot_versions, date_to)
+    transitions = transition_matrix(snapshot_before, snapshot_after, cluster_names)
+
+    # Cluster ordinal: 0 = Low < 1 = Regular < 2 = High
+    k = len(cluster_names)
+    moves = transitions.iloc[:k, :k].to_numpy()
+    stayed, upgraded, downgraded = np.trace(moves), np.triu(moves, 1).sum(), np.tril(moves, -1).sum()
+    for col, value, label in zip(st.columns(4),
+                                 [stayed, upgraded, downgraded, transitions.loc["Baru"].sum()],
+                                 ["Tetap di Cluster", "Naik Cluster", "Turun Cluster", "Pelanggan Baru"]):
+        with col:
+            st.markdown(f"""
+            <div class="metric-box">
+                <div class="metric-value">{int(value):,}</div>
+                <div class="metric-label">{label}</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    def build_transition_heatmap():
+        return charts.transition_heatmap(transitions, f"Matriks Transisi {date_from:%Y-%m-%d} → {date_to:%Y-%m-%d}")
+    plotly_chart_cached(
+        "transition_matrix",
+        (f"{date_from:%Y-%m-%d}", snapshot_versions.get(date_from), f"{date_to:%Y-%m-%d}", snapshot_versions.get(date_to)),
+        build_transition_heatmap, state.version, use_container_width=True
+    )
+
+
+@st.fragment
+def trajectory_section(state, snapshot_dates, snapshot_versions):
+    df_clustered = state.frames[2]
+    trajectory_query = st.text_input("🔍 Cari nama perusahaan untuk melihat trajektorinya:", key="trajectory_search")
+    if trajectory_query:
+        matches = get_search_index(df_clustered["perusahaan"], state.version).search(trajectory_query)[:TOP_K * 5]
+        companies = df_clustered["perusahaan"].to_numpy()[matches]
+        history = trajectories({date: load_snapshot(state, snapshot_versions, date) for date in snapshot_dates},
+                               companies)
+        history = history.apply(lambda column: column.map(cluster_names, na_action="ignore"))
+        st.markdown(gold_table(history.reset_index()), unsafe_allow_html=True)